@@ -1,19 +1,93 @@
 from utils import (
     singleton,
     working_directories,
-    require_conditions,
+    base_path,
     DEBUG_MODE,
-    eLogLevel
+    ASSET_CACHE_BUDGET,
+    ASSET_PRELOAD_WORKERS,
+    ATLAS_INDEX_FILE,
+    BUNDLE_MANIFEST_FILE,
+    eLogLevel,
+    eDirType
 )
 
-from typing import Optional, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Optional, Dict, List, Tuple, Callable, Any, Iterable
 from log import TRACE_LOG
+from bundle import AssetBundle
+import json
 import os
+import time
 
+import pygame
+
+AssetKey = Tuple[str, Optional[Tuple[int, int]]]
+
+button_states: Dict[str, str] = {
+    "default": "default",
+    "hover": "over",
+    "click": "click",
+}
+"""Maps button states to the suffix of their image file."""
+
+
+def convert_surface(surface: pygame.Surface) -> pygame.Surface:
+    """
+    Converts a surface to the display format once a display exists.
+    """
+    if pygame.display.get_surface() is not None:
+        return surface.convert_alpha()
+    return surface
+
+
+class AssetEntry:
+    """
+    Cached surface together with its reference count and size in bytes.
+
+    Entries served from an atlas sheet hold a reference on the sheet (parent) and
+    count no bytes of their own, since their pixels belong to the sheet.
+    """
+
+    def __init__(self, surface: pygame.Surface, parent: Optional[str] = None):
+        self.surface = surface
+        self.refs = 0
+        self.parent = parent
+        self.size = 0 if parent else surface.get_pitch() * surface.get_height()
+
+
+@singleton
 class AssetsManager:
-    def __init__(self):
-        self._path: Optional[str] = ""
-        self._file: Optional[str] = None
+    """
+    Single loading point for image assets.
+
+    Surfaces are cached by path (and target size for scaled variants), so each image is
+    decoded once per process. Every acquire() must be paired with a release(); entries that
+    are no longer referenced are evicted least-recently-used first once the cache exceeds
+    its byte budget.
+
+    If an atlas index (see atlas.py) exists, images packed into it are served as subsurfaces
+    of the atlas sheets instead of being loaded from their own files. If a pre-decoded bundle
+    (see bundle.py) exists, images are created from its memory-mapped pixels without decoding.
+    """
+
+    def __init__(self, budget: int = ASSET_CACHE_BUDGET):
+        self._path: Optional[str] = os.path.join(base_path(), working_directories[eDirType.DIR_TYPE_ASSETS])
+        self._cache: "OrderedDict[AssetKey, AssetEntry]" = OrderedDict()
+
+        self.budget = budget
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+        self._preloaders: List["AssetPreloader"] = []
+
+        self._atlas_sheets: List[str] = []
+        self._atlas_rects: Dict[str, Tuple[int, int, int, int, int]] = {}
+        self.load_atlas()
+
+        self.bundle: Optional[AssetBundle] = None
+        self.load_bundle()
 
     @property
     def path(self) -> Optional[str]:
@@ -25,8 +99,341 @@ class AssetsManager:
     def path(self, path: Optional[str]):
         if DEBUG_MODE:
             TRACE_LOG(eLogLevel.LOG_LEVEL_LOG, f"AssetsManager.path -> setting self._path to: {path}")
-            self._path = path
+        self._path = path
+
+    def full_path(self, asset: str) -> str:
+        return os.path.join(self._path, asset)
+
+    def load_atlas(self) -> bool:
+        """
+        Loads the atlas rect index if one was built.
+
+        Returns:
+            bool: True if an atlas is in use.
+        """
+        index_path = self.full_path(ATLAS_INDEX_FILE)
+        if not os.path.exists(index_path):
+            return False
+
+        try:
+            with open(index_path, "r", encoding="utf-8") as fp:
+                index = json.load(fp)
+            self._atlas_sheets = index["sheets"]
+            self._atlas_rects = {name: tuple(rect) for name, rect in index["images"].items()}
+            return True
+
+        except Exception as err:
+            TRACE_LOG(eLogLevel.LOG_LEVEL_ERROR, f"[AssetsManager] Failed to load atlas index: {err}")
+            self._atlas_sheets, self._atlas_rects = [], {}
+            return False
+
+    def load_bundle(self) -> bool:
+        """
+        Maps the pre-decoded asset bundle if one was built.
+
+        Returns:
+            bool: True if a bundle is in use.
+        """
+        if not os.path.exists(self.full_path(BUNDLE_MANIFEST_FILE)):
+            return False
+
+        try:
+            self.bundle = AssetBundle(self._path)
+        except Exception as err:
+            TRACE_LOG(eLogLevel.LOG_LEVEL_ERROR, f"[AssetsManager] Failed to load asset bundle: {err}")
+            self.bundle = None
+            return False
+
+        if self.bundle.stale:
+            TRACE_LOG(eLogLevel.LOG_LEVEL_WARNING, f"[AssetsManager] Bundle is outdated for: {', '.join(self.bundle.stale)}")
+        return True
+
+    def source_of(self, asset: str) -> str:
+        """
+        Returns the file an asset is decoded from: its atlas sheet if packed, otherwise itself.
+        """
+        rect = self._atlas_rects.get(asset)
+        return self._atlas_sheets[rect[0]] if rect else asset
+
+    def acquire(self, asset: str, size: Optional[Tuple[int, int]] = None) -> pygame.Surface:
+        """
+        Returns the surface of an image asset and takes a reference on it.
+
+        Args:
+            asset (str): Path of the image relative to the assets directory.
+            size (Optional[Tuple[int, int]]): Scale the image to this size.
+
+        Returns:
+            pygame.Surface: The cached surface, converted to the display format.
+        """
+        key = (asset, None if size is None else (int(size[0]), int(size[1])))
+        entry = self._cache.get(key)
+
+        if entry is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+        else:
+            self.misses += 1
+            entry = self._load(*key)
+            self._cache[key] = entry
+            self.used_bytes += entry.size
+
+        entry.refs += 1
+        self._evict()
+        return entry.surface
+
+    def release(self, asset: str, size: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Drops a reference taken by acquire().
+        """
+        key = (asset, None if size is None else (int(size[0]), int(size[1])))
+        entry = self._cache.get(key)
+
+        if entry is None or entry.refs == 0:
+            TRACE_LOG(eLogLevel.LOG_LEVEL_WARNING, f"[AssetsManager] Release of unreferenced asset: {asset}")
+            return
+
+        entry.refs -= 1
+        self._evict()
+
+    def _drop(self, key: AssetKey) -> None:
+        entry = self._cache.pop(key)
+        self.used_bytes -= entry.size
+
+        if entry.parent:
+            parent = self._cache.get((entry.parent, None))
+            if parent is not None and parent.refs:
+                parent.refs -= 1
+
+    def scope(self) -> "AssetScope":
+        return AssetScope(self)
+
+    def insert(self, asset: str, surface: pygame.Surface) -> None:
+        """
+        Adds an already decoded, unreferenced surface to the cache.
+        """
+        key = (asset, None)
+        if key in self._cache:
+            return
+
+        entry = AssetEntry(surface)
+        self._cache[key] = entry
+        self.used_bytes += entry.size
+        self._evict()
+
+    def preload(self, groups: Dict[str, Iterable[str]], workers: int = ASSET_PRELOAD_WORKERS) -> "AssetPreloader":
+        """
+        Starts decoding groups of image assets on a thread pool.
+
+        The returned preloader must be polled from the main thread, which converts the decoded
+        images to the display format and adds them to the cache.
+
+        Args:
+            groups (Dict[str, Iterable[str]]): Asset paths per group name.
+            workers (int): Number of decoding threads.
+
+        Returns:
+            AssetPreloader: Preloader reporting the progress.
+        """
+        preloader = AssetPreloader(self, workers)
+
+        submitted = set()
 
-    @require_conditions
-    def load_file(self, asset: Optional[Any]) -> bool:
-        file = os.path.join(self._path, asset)
+        for group, assets in groups.items():
+            for asset in assets:
+                asset = self.source_of(asset)
+                if (asset, None) in self._cache or asset in submitted:
+                    continue
+
+                if self.bundle is not None and asset in self.bundle:
+                    continue
+
+                submitted.add(asset)
+
+                preloader.submit(
+                    group,
+                    lambda path=self.full_path(asset): pygame.image.load(path),
+                    lambda surface, asset=asset: self.insert(asset, convert_surface(surface))
+                )
+
+        self._preloaders.append(preloader)
+        return preloader
+
+    def poll_preloaders(self, deadline: Optional[float] = None) -> None:
+        """
+        Finalizes decoded images of every running preloader, e.g. as a frame scheduler task.
+
+        Args:
+            deadline (Optional[float]): time.perf_counter() value after which polling stops.
+        """
+        for preloader in list(self._preloaders):
+            preloader.poll(deadline)
+            if preloader.done:
+                self._preloaders.remove(preloader)
+
+    def clear(self) -> None:
+        """
+        Drops every unreferenced entry regardless of the budget.
+        """
+        for key in list(self._cache):
+            if key in self._cache and self._cache[key].refs == 0:
+                self._drop(key)
+
+    def _load(self, asset: str, size: Optional[Tuple[int, int]]) -> AssetEntry:
+        if size is not None:
+            surface = pygame.transform.scale(self.acquire(asset), size)
+            self.release(asset)
+            return AssetEntry(surface)
+
+        rect = self._atlas_rects.get(asset)
+        if rect is not None:
+            sheet_name = self._atlas_sheets[rect[0]]
+            sheet = self.acquire(sheet_name)
+            return AssetEntry(sheet.subsurface(pygame.Rect(rect[1:])), parent=sheet_name)
+
+        if self.bundle is not None and asset in self.bundle:
+            return AssetEntry(convert_surface(self.bundle.surface(asset)))
+
+        return AssetEntry(convert_surface(pygame.image.load(self.full_path(asset))))
+
+    def _evict(self) -> None:
+        if self.used_bytes <= self.budget:
+            return
+
+        for key in list(self._cache):
+            entry = self._cache.get(key)
+            if entry is None or entry.refs:
+                continue
+
+            self._drop(key)
+
+            if self.used_bytes <= self.budget:
+                break
+
+
+class AssetScope:
+    """
+    Tracks the assets acquired by one owner (a screen or a board) so they can be released together.
+    """
+
+    def __init__(self, manager: AssetsManager):
+        self.manager = manager
+        self._keys: List[AssetKey] = []
+
+    def image(self, asset: str, size: Optional[Tuple[int, int]] = None) -> pygame.Surface:
+        """
+        Acquires an image asset for the lifetime of this scope.
+        """
+        surface = self.manager.acquire(asset, size)
+        self._keys.append((asset, size))
+        return surface
+
+    def button_states(self, folder: str, name: str) -> Dict[str, pygame.Surface]:
+        """
+        Acquires the default, hover and click images of a button.
+
+        Args:
+            folder (str): Folder of the button images relative to the assets directory.
+            name (str): Base name of the button.
+
+        Returns:
+            Dict[str, pygame.Surface]: Surface per button state.
+        """
+        return {
+            state: self.image(f"{folder}/{name}_{suffix}.png")
+            for state, suffix in button_states.items()
+        }
+
+    def release(self) -> None:
+        """
+        Releases every asset acquired through this scope.
+        """
+        keys, self._keys = self._keys, []
+        for asset, size in keys:
+            self.manager.release(asset, size)
+
+
+class AssetPreloader:
+    """
+    Runs decode tasks on a thread pool and finalizes their results on the main thread.
+
+    Decoding (file I/O and image codecs) happens on the workers; poll() runs the finalize
+    step of every finished task, so anything touching the display stays on the main thread.
+    """
+
+    def __init__(self, manager: AssetsManager, workers: int = ASSET_PRELOAD_WORKERS):
+        self.manager = manager
+
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="AssetPreload")
+        self._pending: List[Tuple[str, Future, Callable[[Any], None]]] = []
+        self._totals: Dict[str, int] = {}
+        self._done: Dict[str, int] = {}
+
+    def submit(self, group: str, decode: Callable[[], Any], finalize: Callable[[Any], None]) -> None:
+        """
+        Queues a task.
+
+        Args:
+            group (str): Group the task is counted in.
+            decode (Callable[[], Any]): Runs on a worker thread and returns the decoded data.
+            finalize (Callable[[Any], None]): Runs on the main thread with the decoded data.
+        """
+        self._pending.append((group, self._executor.submit(decode), finalize))
+        self._totals[group] = self._totals.get(group, 0) + 1
+        self._done.setdefault(group, 0)
+
+    def poll(self, deadline: Optional[float] = None) -> float:
+        """
+        Finalizes every task whose decoding has finished. Call once per frame from the main thread.
+        The worker threads exit once every task is finalized; no tasks can be submitted after that.
+
+        Args:
+            deadline (Optional[float]): time.perf_counter() value after which the remaining
+                finished tasks are left for the next poll. At least one finished task is
+                finalized per poll even if the deadline has already passed.
+
+        Returns:
+            float: Overall progress between 0.0 and 1.0.
+        """
+        still_pending = []
+        finalized = False
+
+        for group, future, finalize in self._pending:
+            if not future.done() or (finalized and deadline is not None and time.perf_counter() >= deadline):
+                still_pending.append((group, future, finalize))
+                continue
+
+            try:
+                finalize(future.result())
+            except Exception as err:
+                TRACE_LOG(eLogLevel.LOG_LEVEL_ERROR, f"[AssetsManager] Preloading failed in group {group}: {err}")
+
+            self._done[group] += 1
+            finalized = True
+
+        self._pending = still_pending
+        if not self._pending:
+            self._executor.shutdown(wait=False)
+
+        return self.progress
+
+    def wait(self) -> None:
+        """
+        Blocks until every task is decoded and finalized.
+        """
+        for _, future, _ in self._pending:
+            future.exception()
+        self.poll()
+
+    @property
+    def progress(self) -> float:
+        total = sum(self._totals.values())
+        return sum(self._done.values()) / total if total else 1.0
+
+    def group_progress(self, group: str) -> float:
+        total = self._totals.get(group, 0)
+        return self._done.get(group, 0) / total if total else 1.0
+
+    @property
+    def done(self) -> bool:
+        return not self._pending
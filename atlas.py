@@ -0,0 +1,122 @@
+import glob
+import json
+import os
+from typing import Dict, List, Tuple
+
+import pygame
+
+from assets_manager import AssetsManager, button_states
+from utils import ATLAS_MAX_SIZE, ATLAS_INDEX_FILE
+
+atlas_folders: Dict[str, List[str]] = {
+    "buttons": ["buttons", "ui/loads"],
+}
+"""Maps atlas names to the asset folders whose multi-state buttons they pack."""
+
+AtlasRect = Tuple[int, int, int, int, int]
+
+
+def find_button_images(assets_path: str, folders: List[str]) -> List[str]:
+    """
+    Finds every image of a multi-state button (name_default/_over/_click.png) in the given folders.
+
+    Args:
+        assets_path (str): Root of the assets directory.
+        folders (List[str]): Folders relative to the assets directory.
+
+    Returns:
+        List[str]: Asset paths relative to the assets directory.
+    """
+    images = []
+    for folder in folders:
+        for suffix in button_states.values():
+            for path in glob.glob(os.path.join(assets_path, folder, f"*_{suffix}.png")):
+                images.append(os.path.relpath(path, assets_path).replace(os.sep, "/"))
+    return sorted(images)
+
+
+def pack(sizes: Dict[str, Tuple[int, int]], max_size: int = ATLAS_MAX_SIZE, padding: int = 1) -> Dict[str, AtlasRect]:
+    """
+    Packs rectangles into as few max_size x max_size sheets as possible using shelf packing.
+
+    Args:
+        sizes (Dict[str, Tuple[int, int]]): Size per image.
+        max_size (int): Width and height limit of a sheet.
+        padding (int): Empty pixels kept between images.
+
+    Returns:
+        Dict[str, AtlasRect]: (sheet, x, y, width, height) per image.
+    """
+    placement: Dict[str, AtlasRect] = {}
+    sheet, x, y, shelf_height = 0, 0, 0, 0
+
+    for name, (width, height) in sorted(sizes.items(), key=lambda item: (-item[1][1], item[0])):
+        if width > max_size or height > max_size:
+            raise ValueError(f"Image {name} ({width}x{height}) does not fit into a {max_size}px atlas")
+
+        if x + width > max_size:
+            x, y = 0, y + shelf_height + padding
+            shelf_height = 0
+
+        if y + height > max_size:
+            sheet, x, y, shelf_height = sheet + 1, 0, 0, 0
+
+        placement[name] = (sheet, x, y, width, height)
+        x += width + padding
+        shelf_height = max(shelf_height, height)
+
+    return placement
+
+
+def build_atlas(folders: Dict[str, List[str]] = atlas_folders, max_size: int = ATLAS_MAX_SIZE) -> Dict[str, object]:
+    """
+    Packs the button images into atlas sheets and writes the sheets and the rect index
+    to the assets directory, where AssetsManager picks them up on its next start.
+
+    Args:
+        folders (Dict[str, List[str]]): Folders to pack per atlas name.
+        max_size (int): Width and height limit of a sheet.
+
+    Returns:
+        Dict[str, object]: The written index.
+    """
+    assets_path = AssetsManager().path
+    index: Dict[str, object] = {"sheets": [], "images": {}}
+
+    for atlas_name, atlas_dirs in folders.items():
+        images = {name: pygame.image.load(os.path.join(assets_path, name)) for name in find_button_images(assets_path, atlas_dirs)}
+        placement = pack({name: image.get_size() for name, image in images.items()}, max_size)
+
+        sheet_count = max((rect[0] for rect in placement.values()), default=-1) + 1
+        first_sheet = len(index["sheets"])
+
+        for sheet in range(sheet_count):
+            rects = [rect for rect in placement.values() if rect[0] == sheet]
+            width = max(x + w for _, x, _, w, _ in rects)
+            height = max(y + h for _, _, y, _, h in rects)
+
+            surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            for name, (image_sheet, x, y, _, _) in placement.items():
+                if image_sheet == sheet:
+                    surface.blit(images[name], (x, y))
+
+            sheet_path = f"{os.path.dirname(ATLAS_INDEX_FILE)}/{atlas_name}_{sheet}.png"
+            os.makedirs(os.path.dirname(os.path.join(assets_path, sheet_path)), exist_ok=True)
+            pygame.image.save(surface, os.path.join(assets_path, sheet_path))
+            index["sheets"].append(sheet_path)
+
+        for name, (sheet, x, y, w, h) in placement.items():
+            index["images"][name] = [first_sheet + sheet, x, y, w, h]
+
+    with open(os.path.join(assets_path, ATLAS_INDEX_FILE), "w", encoding="utf-8") as fp:
+        json.dump(index, fp, indent=1)
+
+    return index
+
+
+if __name__ == "__main__":
+    """
+    Rebuilds the atlas sheets from the button images.
+    """
+    result = build_atlas()
+    print(f"Packed {len(result['images'])} images into {len(result['sheets'])} sheet(s).")
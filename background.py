@@ -0,0 +1,326 @@
+import queue
+import threading
+from typing import TYPE_CHECKING, Optional, Tuple, Iterator, Callable, List
+
+import pygame
+
+from assets_manager import AssetsManager
+from log import TRACE_LOG
+from utils import eLogLevel, BACKGROUND_BUFFER_FRAMES, BACKGROUND_FRAME_DELAY, BACKGROUND_DELTA_BANDS
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+DecodedFrame = Tuple[bytes, Tuple[int, int], int]
+
+
+def iter_gif_frames(path: str, size: Tuple[int, int]) -> Iterator[DecodedFrame]:
+    """
+    Decodes a GIF one frame at a time, scaled to size.
+
+    Yields:
+        DecodedFrame: (RGBA pixels, size, duration in ms) per frame.
+    """
+    from PIL import Image
+
+    with Image.open(path) as gif:
+        for index in range(getattr(gif, "n_frames", 1)):
+            gif.seek(index)
+            duration = gif.info.get("duration") or BACKGROUND_FRAME_DELAY
+            frame = gif.convert("RGBA")
+            if frame.size != size:
+                frame = frame.resize(size, Image.BILINEAR)
+            yield frame.tobytes(), size, duration
+
+
+def iter_bundled_frames(asset: str, size: Tuple[int, int]) -> Optional[Callable[[], Iterator[DecodedFrame]]]:
+    """
+    Returns a frame iterator factory reading an animation from the asset bundle, or None if it is not bundled.
+    """
+    bundle = AssetsManager().bundle
+    frames = bundle.frame_data(asset) if bundle is not None else None
+    if frames is None:
+        return None
+
+    def iterate() -> Iterator[DecodedFrame]:
+        from PIL import Image
+
+        for pixels, frame_size, duration in frames:
+            if frame_size != size:
+                image = Image.frombuffer("RGBA", frame_size, pixels, "raw", "RGBA", 0, 1).resize(size, Image.BILINEAR)
+                yield image.tobytes(), size, duration or BACKGROUND_FRAME_DELAY
+            else:
+                yield bytes(pixels), size, duration or BACKGROUND_FRAME_DELAY
+
+    return iterate
+
+
+def changed_rects(previous: "Image.Image", current: "Image.Image", bands: int = BACKGROUND_DELTA_BANDS) -> List[Tuple[int, int, int, int]]:
+    """
+    Returns the rectangles in which two equally sized frames differ.
+
+    The frame is split into horizontal bands and each band contributes at most one bounding box,
+    so separate moving regions do not merge into one frame-sized rectangle.
+
+    Returns:
+        List[Tuple[int, int, int, int]]: (x, y, width, height) per changed region.
+    """
+    from PIL import ImageChops
+
+    width, height = current.size
+    band_height = max(1, -(-height // bands))
+    rects = []
+
+    for top in range(0, height, band_height):
+        box = (0, top, width, min(height, top + band_height))
+        bbox = ImageChops.difference(previous.crop(box), current.crop(box)).getbbox(alpha_only=False)
+        if bbox:
+            left, upper, right, lower = bbox
+            rects.append((left, top + upper, right - left, lower - upper))
+
+    return rects
+
+
+class BackgroundPlayer:
+    """
+    Streams an animated background.
+
+    A worker thread decodes and scales frames ahead of time into a bounded prefetch buffer,
+    so memory stays at buffer_size frames regardless of the animation length. The main thread
+    converts each frame to the display format when it becomes current and advances frames
+    according to their own durations.
+
+    If decoding fails or the animation has no frames, the worker finishes without ever
+    becoming ready; failed is then True and draw() falls back to a black background.
+    """
+
+    def __init__(self, asset: str, size: Tuple[int, int], buffer_size: int = BACKGROUND_BUFFER_FRAMES):
+        self.asset = asset
+        self.size = size
+        self.buffer_size = buffer_size
+
+        self.surface: Optional[pygame.Surface] = None
+        self.next_frame_time: int = 0
+
+        self._frame_count: Optional[int] = None
+        self._buffer: "queue.Queue[DecodedFrame]" = queue.Queue(maxsize=buffer_size)
+        self._stop_event = threading.Event()
+        self._finished = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+        self.start()
+
+    @property
+    def ready(self) -> bool:
+        return self.surface is not None or not self._buffer.empty()
+
+    @property
+    def finished(self) -> bool:
+        """
+        True once the worker thread has exited, whether it succeeded or not.
+        """
+        return self._finished.is_set()
+
+    @property
+    def failed(self) -> bool:
+        """
+        True if the worker exited without producing a frame.
+        """
+        return self._finished.is_set() and not self.ready
+
+    @property
+    def is_static(self) -> bool:
+        return self._frame_count == 1 or self.failed
+
+    def start(self) -> None:
+        self._stop_event.clear()
+        self._finished.clear()
+        self._worker = threading.Thread(target=self._finish_after, args=(self._run,), name="BackgroundPlayer", daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+
+        while not self._buffer.empty():
+            self._buffer.get_nowait()
+
+    def resize(self, size: Tuple[int, int]) -> None:
+        """
+        Restarts streaming with frames scaled to a new size.
+        """
+        if size == self.size:
+            return
+
+        self.stop()
+        self.size = size
+        self.surface = None
+        self.start()
+
+    def update(self, now: int, animate: bool = True) -> bool:
+        """
+        Advances to the next frame once the current frame's duration has elapsed.
+
+        Args:
+            now (int): Current time in milliseconds (pygame.time.get_ticks()).
+            animate (bool): Whether frames should advance at all.
+
+        Returns:
+            bool: True if the current frame changed.
+        """
+        if self.surface is not None and (not animate or now < self.next_frame_time):
+            return False
+
+        try:
+            pixels, size, duration = self._buffer.get_nowait()
+        except queue.Empty:
+            return False
+
+        self.surface = pygame.image.frombuffer(pixels, size, "RGBA").convert()
+        self.next_frame_time = now + duration
+        return True
+
+    def draw(self, screen: pygame.Surface) -> None:
+        if self.surface is not None:
+            screen.blit(self.surface, (0, 0))
+        else:
+            screen.fill((0, 0, 0))
+
+    def _frames(self) -> Iterator[DecodedFrame]:
+        bundled = iter_bundled_frames(self.asset, self.size)
+        if bundled is not None:
+            return bundled()
+        return iter_gif_frames(AssetsManager().full_path(self.asset), self.size)
+
+    def _put(self, frame: DecodedFrame) -> bool:
+        while not self._stop_event.is_set():
+            try:
+                self._buffer.put(frame, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _finish_after(self, run: Callable[[], None]) -> None:
+        try:
+            run()
+        finally:
+            self._finished.set()
+
+    def _run(self) -> None:
+        try:
+            while not self._stop_event.is_set():
+                count = 0
+                for frame in self._frames():
+                    if not self._put(frame):
+                        return
+                    count += 1
+
+                self._frame_count = count
+                if count == 0:
+                    TRACE_LOG(eLogLevel.LOG_LEVEL_WARNING, f"[BackgroundPlayer] {self.asset} has no frames")
+                if count <= 1:
+                    return
+
+        except Exception as err:
+            TRACE_LOG(eLogLevel.LOG_LEVEL_ERROR, f"[BackgroundPlayer] Failed to decode {self.asset}: {err}")
+
+
+class DeltaBackgroundPlayer(BackgroundPlayer):
+    """
+    Plays an animated background stored as one keyframe plus the changed patches of every frame.
+
+    The worker thread decodes the animation once and keeps only the regions that differ from
+    the previous frame. Advancing a frame blits just those patches onto the canvas and records
+    them in dirty_rects for a partial display update, so memory and fill cost scale with the
+    amount of motion instead of the resolution.
+    """
+
+    def __init__(self, asset: str, size: Tuple[int, int]):
+        self._keyframe: Optional[DecodedFrame] = None
+        self._raw_deltas: Optional[List[Tuple[List[Tuple[Tuple[int, int, int, int], bytes]], int]]] = None
+        self._deltas: List[Tuple[List[Tuple[pygame.Rect, pygame.Surface]], int]] = []
+        self._index = 0
+
+        self.dirty_rects: List[pygame.Rect] = []
+
+        super().__init__(asset, size)
+
+    @property
+    def ready(self) -> bool:
+        return self.surface is not None or self._raw_deltas is not None
+
+    def stop(self) -> None:
+        super().stop()
+        self._keyframe, self._raw_deltas, self._deltas = None, None, []
+
+    def update(self, now: int, animate: bool = True) -> bool:
+        if self.surface is None:
+            if self._raw_deltas is None:
+                return False
+            self._prepare()
+            self.next_frame_time = now + self._deltas[0][1]
+            self.dirty_rects = [self.surface.get_rect()]
+            return True
+
+        if not animate or now < self.next_frame_time or len(self._deltas) <= 1:
+            self.dirty_rects = []
+            return False
+
+        self._index = (self._index + 1) % len(self._deltas)
+        patches, duration = self._deltas[self._index]
+
+        for rect, patch in patches:
+            self.surface.blit(patch, rect)
+
+        self.dirty_rects = [rect for rect, _ in patches]
+        self.next_frame_time = now + duration
+        return bool(self.dirty_rects)
+
+    def _prepare(self) -> None:
+        pixels, size, _ = self._keyframe
+        self.surface = pygame.image.frombuffer(pixels, size, "RGBA").convert()
+
+        self._deltas = [
+            ([(pygame.Rect(rect), pygame.image.frombuffer(patch, rect[2:], "RGBA").convert()) for rect, patch in patches], duration)
+            for patches, duration in self._raw_deltas
+        ]
+        self._index = 0
+        self._keyframe, self._raw_deltas = None, None
+
+    def _run(self) -> None:
+        from PIL import Image
+
+        try:
+            first: Optional[Image.Image] = None
+            previous: Optional[Image.Image] = None
+            deltas = []
+
+            for pixels, size, duration in self._frames():
+                if self._stop_event.is_set():
+                    return
+
+                current = Image.frombytes("RGBA", size, pixels)
+                if previous is None:
+                    first = current
+                    self._keyframe = (pixels, size, duration)
+                    deltas.append(([], duration))
+                else:
+                    rects = changed_rects(previous, current)
+                    deltas.append(([(rect, current.crop((rect[0], rect[1], rect[0] + rect[2], rect[1] + rect[3])).tobytes()) for rect in rects], duration))
+                previous = current
+
+            if first is None:
+                TRACE_LOG(eLogLevel.LOG_LEVEL_WARNING, f"[DeltaBackgroundPlayer] {self.asset} has no frames")
+                return
+
+            rects = changed_rects(previous, first)
+            deltas[0] = ([(rect, first.crop((rect[0], rect[1], rect[0] + rect[2], rect[1] + rect[3])).tobytes()) for rect in rects], deltas[0][1])
+
+            self._frame_count = len(deltas)
+            self._raw_deltas = deltas
+
+        except Exception as err:
+            TRACE_LOG(eLogLevel.LOG_LEVEL_ERROR, f"[DeltaBackgroundPlayer] Failed to decode {self.asset}: {err}")
@@ -0,0 +1,359 @@
+import argparse
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from file_manager import FileManager
+from utils import (
+    eFileType,
+    eFontType,
+    eLogLevel,
+    filename_from_enum,
+    file_name_map,
+    singleton,
+    require_conditions,
+    require_valid_enum,
+    get_font,
+    LOG_ASYNC_MODE
+)
+
+BenchResult = Dict[str, float]
+"""calls_per_sec, peak_bytes_per_call and retained_bytes_per_call of one benchmark."""
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "micro_baseline.json")
+REGRESSION_TOLERANCE = 0.25
+ALLOCATION_SAMPLES = 200
+REPEAT = 5
+
+
+def measure(func: Callable[[], None], iterations: int) -> float:
+    """
+    Runs func the given number of times and returns the calls per second.
+
+    Args:
+        func (Callable[[], None]): Function to benchmark.
+        iterations (int): Number of calls.
+
+    Returns:
+        float: Calls per second.
+    """
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - start
+    return iterations / elapsed if elapsed > 0 else float("inf")
+
+
+def measure_allocations(func: Callable[[], None], iterations: int = ALLOCATION_SAMPLES) -> Tuple[float, float]:
+    """
+    Measures the memory func allocates per call with tracemalloc.
+
+    Args:
+        func (Callable[[], None]): Function to benchmark.
+        iterations (int): Number of sampled calls.
+
+    Returns:
+        Tuple[float, float]: Average peak bytes allocated during a call, and average bytes still held after it.
+    """
+    tracemalloc.start()
+    try:
+        func()
+
+        peak_total = 0
+        start_current = tracemalloc.get_traced_memory()[0]
+
+        for _ in range(iterations):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            func()
+            peak_total += tracemalloc.get_traced_memory()[1] - before
+
+        retained = tracemalloc.get_traced_memory()[0] - start_current
+    finally:
+        tracemalloc.stop()
+
+    return peak_total / iterations, retained / iterations
+
+
+def bench(func: Callable[[], None], iterations: int, repeat: int = REPEAT) -> BenchResult:
+    """
+    Measures throughput and allocations of func.
+
+    The throughput is the best of repeat runs, as with timeit, since slower runs only add
+    noise from the rest of the system.
+
+    Args:
+        func (Callable[[], None]): Function to benchmark.
+        iterations (int): Number of calls per run.
+        repeat (int): Number of runs.
+
+    Returns:
+        BenchResult: The measurements.
+    """
+    func()
+    peak, retained = measure_allocations(func, min(iterations, ALLOCATION_SAMPLES))
+
+    return {
+        "calls_per_sec": round(max(measure(func, iterations) for _ in range(repeat)), 1),
+        "peak_bytes_per_call": round(peak, 1),
+        "retained_bytes_per_call": round(retained, 1),
+    }
+
+
+def bench_file_appends(iterations: int = 20000) -> Dict[str, float]:
+    """
+    Measures appends per second to the log files with and without the handle pool.
+
+    The "unpooled" case closes the pool after every append, which reproduces the
+    previous open/append/close cycle of FileManager.write_file.
+
+    Args:
+        iterations (int): Number of appends per case.
+
+    Returns:
+        Dict[str, float]: Appends per second for each case.
+    """
+    line = "[2000-01-01 00:00:00] [<Log>] -> benchmark line"
+    results: Dict[str, float] = {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_manager = FileManager()
+        file_manager.working_dir = tmp_dir
+
+        for file_type in (eFileType.FILE_LOG, eFileType.FILE_SYSERR):
+            file_name = filename_from_enum(file_type)
+
+            def unpooled():
+                file_manager.write_file(file_name, line)
+                file_manager.pool.close(os.path.join(tmp_dir, file_name))
+
+            def pooled():
+                file_manager.write_file(file_name, line)
+
+            results[f"{file_name} unpooled"] = measure(unpooled, iterations)
+            results[f"{file_name} pooled"] = measure(pooled, iterations)
+            file_manager.pool.close(os.path.join(tmp_dir, file_name))
+
+    return results
+
+
+@contextlib.contextmanager
+def quiet_log(tmp_dir: str) -> Iterator["Log"]:
+    """
+    Points the Log singleton at a temporary directory and silences its console output.
+    """
+    from log import Log
+
+    log = Log()
+    working_dir = log.manager_instance.working_dir
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        log.shutdown()
+        log.manager_instance.working_dir = tmp_dir
+        try:
+            yield log
+        finally:
+            log.shutdown()
+            log.manager_instance.close_all()
+            log.manager_instance.working_dir = working_dir
+
+    if LOG_ASYNC_MODE:
+        log.start_async()
+
+
+def bench_logging(iterations: int = 20000) -> Dict[str, BenchResult]:
+    from log import TRACE_LOG
+
+    results: Dict[str, BenchResult] = {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir, quiet_log(tmp_dir) as log:
+        results["log.trace_log sync"] = bench(lambda: TRACE_LOG(eLogLevel.LOG_LEVEL_LOG, "benchmark message"), iterations)
+
+        log.start_async()
+        results["log.trace_log async"] = bench(lambda: TRACE_LOG(eLogLevel.LOG_LEVEL_LOG, "benchmark message"), iterations)
+        results["log.log error async"] = bench(lambda: log.log(eLogLevel.LOG_LEVEL_ERROR, "benchmark error"), iterations)
+
+    return results
+
+
+def bench_files(iterations: int = 20000) -> Dict[str, BenchResult]:
+    line = "[2000-01-01 00:00:00] [<Log>] -> benchmark line"
+    results: Dict[str, BenchResult] = {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_manager = FileManager()
+        file_manager.working_dir = tmp_dir
+
+        results["file.write_file pooled"] = bench(lambda: file_manager.write_file("write.txt", line), iterations)
+
+        file_manager.write_file("read.txt", [line] * 100)
+        file_manager.flush()
+        results["file.read_file 100 lines"] = bench(lambda: file_manager.read_file("read.txt"), iterations // 10)
+
+        file_manager.close_all()
+
+    return results
+
+
+def bench_config(iterations: int = 20000) -> Dict[str, BenchResult]:
+    from config import Config
+
+    results: Dict[str, BenchResult] = {}
+    config_name = file_name_map[eFileType.FILE_CONFIG]
+
+    with tempfile.TemporaryDirectory() as tmp_dir, quiet_log(tmp_dir):
+        config = Config(config_name, config_path=tmp_dir)
+        config.save(immediate=True)
+
+        results["config._load_config"] = bench(config._load_config, iterations // 10)
+        results["config.save deferred"] = bench(config.save, iterations)
+        results["config.save immediate"] = bench(lambda: config.save(immediate=True), iterations // 10)
+        results["config.volume getter"] = bench(lambda: config.volume, iterations * 10)
+        results["config.resolution getter"] = bench(lambda: config.resolution, iterations * 10)
+
+        config.unwatch()
+        config._dirty = False
+
+    return results
+
+
+@singleton
+class _BenchSingleton:
+    pass
+
+
+class _BenchWrappers:
+    def __init__(self):
+        self.working_dir = "bench"
+
+    @require_conditions(check_class_attr="working_dir", check_args_not_null=True)
+    def checked(self, value):
+        return value
+
+    @require_valid_enum(eFileType)
+    def enum_checked(self, value):
+        return value
+
+    def plain(self, value):
+        return value
+
+
+def bench_utils(iterations: int = 200000) -> Dict[str, BenchResult]:
+    import pygame
+
+    wrappers = _BenchWrappers()
+    results: Dict[str, BenchResult] = {
+        "utils.singleton lookup": bench(_BenchSingleton, iterations),
+        "utils.plain method (reference)": bench(lambda: wrappers.plain("x"), iterations),
+        "utils.require_conditions": bench(lambda: wrappers.checked("x"), iterations),
+        "utils.require_valid_enum": bench(lambda: wrappers.enum_checked(eFileType.FILE_LOG.value), iterations),
+    }
+
+    pygame.font.init()
+    if get_font(eFontType.FONT_TYPE_UPHEAVAL, 24):
+        results["utils.get_font cache hit"] = bench(lambda: get_font(eFontType.FONT_TYPE_UPHEAVAL, 24), iterations)
+
+    return results
+
+
+suites: Dict[str, Callable[[], Dict[str, BenchResult]]] = {
+    "logging": bench_logging,
+    "files": bench_files,
+    "config": bench_config,
+    "utils": bench_utils,
+}
+"""Benchmark suites by name."""
+
+
+def run_suites(names: Optional[List[str]] = None) -> Dict[str, BenchResult]:
+    results: Dict[str, BenchResult] = {}
+    for name, suite in suites.items():
+        if names is None or name in names:
+            results.update(suite())
+    return results
+
+
+def compare(results: Dict[str, BenchResult], baseline: Dict[str, BenchResult], tolerance: float = REGRESSION_TOLERANCE) -> Tuple[List[str], List[str]]:
+    """
+    Builds a comparison report of the results against a baseline.
+
+    Throughput regresses when it drops by more than the tolerance; allocations regress when
+    the peak per call grows by more than the tolerance (and by at least 64 bytes).
+
+    Args:
+        results (Dict[str, BenchResult]): Current results.
+        baseline (Dict[str, BenchResult]): Stored results.
+        tolerance (float): Allowed relative change, e.g. 0.25 for 25 %.
+
+    Returns:
+        Tuple[List[str], List[str]]: Report lines and regression lines.
+    """
+    lines = [f"{'benchmark':<34} {'calls/s':>12} {'baseline':>12} {'change':>8} {'peak B':>9} {'baseline':>9}"]
+    regressions = []
+
+    for name, result in results.items():
+        base = baseline.get(name)
+        rate, peak = result["calls_per_sec"], result["peak_bytes_per_call"]
+
+        if not base:
+            lines.append(f"{name:<34} {rate:>12,.0f} {'-':>12} {'new':>8} {peak:>9,.0f} {'-':>9}")
+            continue
+
+        change = rate / base["calls_per_sec"] - 1 if base["calls_per_sec"] else 0.0
+        lines.append(
+            f"{name:<34} {rate:>12,.0f} {base['calls_per_sec']:>12,.0f} {change * 100:>+7.0f}% "
+            f"{peak:>9,.0f} {base['peak_bytes_per_call']:>9,.0f}"
+        )
+
+        if change < -tolerance:
+            regressions.append(f"{name}: {rate:,.0f} calls/s vs baseline {base['calls_per_sec']:,.0f} ({change * 100:+.0f}%)")
+
+        if peak > base["peak_bytes_per_call"] * (1 + tolerance) and peak - base["peak_bytes_per_call"] >= 64:
+            regressions.append(f"{name}: {peak:,.0f} peak bytes/call vs baseline {base['peak_bytes_per_call']:,.0f}")
+
+    return lines, regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Micro-benchmarks of the logging, file, config and utility layer.")
+    parser.add_argument("--suite", action="append", choices=sorted(suites), help="run only these suites")
+    parser.add_argument("--output", help="write the JSON results to this file")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline results to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=REGRESSION_TOLERANCE, help="allowed relative change")
+    parser.add_argument("--appends", action="store_true", help="only compare pooled and unpooled log appends")
+    args = parser.parse_args()
+
+    if args.appends:
+        for name, rate in bench_file_appends().items():
+            print(f"{name:<24} {rate:>12,.0f} appends/s")
+        sys.exit(0)
+
+    results = run_suites(args.suite)
+
+    baseline: Dict[str, BenchResult] = {}
+    if os.path.exists(args.baseline) and not args.update_baseline:
+        with open(args.baseline, "r", encoding="utf-8") as fp:
+            baseline = json.load(fp)
+
+    report, regressions = compare(results, baseline, args.tolerance)
+    print("\n".join(report))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            json.dump(results, fp, indent=2)
+
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as fp:
+            json.dump(results, fp, indent=2)
+        print(f"Baseline written to {args.baseline}")
+
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,230 @@
+import hashlib
+import json
+import mmap
+import os
+from typing import Dict, List, Optional, Tuple, Any
+
+import pygame
+
+from utils import (
+    base_path,
+    working_directories,
+    eDirType,
+    BUNDLE_DATA_FILE,
+    BUNDLE_MANIFEST_FILE
+)
+
+BUNDLE_VERSION = 1
+BUNDLE_ALIGNMENT = 64
+BUNDLE_SOURCE_TYPES = (".png", ".gif")
+
+
+def assets_path() -> str:
+    return os.path.join(base_path(), working_directories[eDirType.DIR_TYPE_ASSETS])
+
+
+def file_hash(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as fp:
+        for chunk in iter(lambda: fp.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def find_sources(root: str) -> List[str]:
+    """
+    Lists every image under the assets directory that can be bundled, relative to it.
+    """
+    bundle_dir = os.path.dirname(BUNDLE_DATA_FILE)
+    sources = []
+
+    for folder, _, files in os.walk(root):
+        rel_folder = os.path.relpath(folder, root).replace(os.sep, "/")
+        if rel_folder == bundle_dir or rel_folder.startswith(bundle_dir + "/"):
+            continue
+
+        for name in files:
+            if name.lower().endswith(BUNDLE_SOURCE_TYPES):
+                sources.append(name if rel_folder == "." else f"{rel_folder}/{name}")
+
+    return sorted(sources)
+
+
+def decode_source(path: str) -> List[Tuple[bytes, Tuple[int, int], Optional[int]]]:
+    """
+    Decodes an image into raw RGBA frames.
+
+    Returns:
+        List[Tuple[bytes, Tuple[int, int], Optional[int]]]: (pixels, size, duration in ms) per frame.
+            Still images have a single frame without duration.
+    """
+    if path.lower().endswith(".gif"):
+        from PIL import Image
+
+        frames = []
+        gif = Image.open(path)
+        try:
+            while True:
+                frame = gif.convert("RGBA")
+                frames.append((frame.tobytes(), frame.size, gif.info.get("duration")))
+                gif.seek(gif.tell() + 1)
+        except EOFError:
+            pass
+        return frames
+
+    surface = pygame.image.load(path)
+    return [(pygame.image.tostring(surface, "RGBA"), surface.get_size(), None)]
+
+
+class AssetBundle:
+    """
+    Read-only view of a pre-decoded asset bundle.
+
+    The pixel data file is memory-mapped; surfaces are created directly on top of the
+    mapping, so loading an asset costs no image decoding. Entries whose source file
+    changed since the bundle was built are ignored.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.animations: Dict[str, List[str]] = {}
+
+        with open(os.path.join(root, BUNDLE_MANIFEST_FILE), "r", encoding="utf-8") as fp:
+            manifest = json.load(fp)
+
+        if manifest.get("version") != BUNDLE_VERSION:
+            raise ValueError(f"Unsupported bundle version: {manifest.get('version')}")
+
+        self._fp = open(os.path.join(root, BUNDLE_DATA_FILE), "rb")
+        self._map = mmap.mmap(self._fp.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+
+        fresh = {source for source, info in manifest["sources"].items() if not self._is_stale(source, info)}
+        self.stale = sorted(set(manifest["sources"]) - fresh)
+
+        self.entries = {name: entry for name, entry in manifest["entries"].items() if entry["source"] in fresh}
+        self.animations = {name: frames for name, frames in manifest["animations"].items() if name in fresh}
+
+    def _is_stale(self, source: str, info: Dict[str, Any]) -> bool:
+        path = os.path.join(self.root, source)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return True
+
+        if st.st_size == info["bytes"] and st.st_mtime_ns == info["mtime_ns"]:
+            return False
+        return file_hash(path) != info["hash"]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def surface(self, name: str) -> pygame.Surface:
+        """
+        Returns a surface sharing its pixels with the mapped bundle.
+        """
+        entry = self.entries[name]
+        data = self._view[entry["offset"]:entry["offset"] + entry["length"]]
+        return pygame.image.frombuffer(data, tuple(entry["size"]), entry["format"])
+
+    def frame_data(self, name: str) -> Optional[List[Tuple[memoryview, Tuple[int, int], Optional[int]]]]:
+        """
+        Returns (mapped RGBA pixels, size, duration in ms) for every frame of a bundled animation, or None.
+        """
+        frames = self.animations.get(name)
+        if frames is None:
+            return None
+
+        data = []
+        for frame in frames:
+            entry = self.entries[frame]
+            pixels = self._view[entry["offset"]:entry["offset"] + entry["length"]]
+            data.append((pixels, tuple(entry["size"]), entry.get("duration")))
+        return data
+
+
+def build_bundle(root: Optional[str] = None, force: bool = False) -> bool:
+    """
+    Decodes every image under the assets directory into the bundle, unless the existing
+    bundle was built from sources with the same content hashes.
+
+    Args:
+        root (Optional[str]): Assets directory, defaults to the game's assets directory.
+        force (bool): Rebuild even if nothing changed.
+
+    Returns:
+        bool: True if the bundle was rebuilt.
+    """
+    root = root or assets_path()
+    manifest_path = os.path.join(root, BUNDLE_MANIFEST_FILE)
+    data_path = os.path.join(root, BUNDLE_DATA_FILE)
+
+    sources: Dict[str, Dict[str, Any]] = {}
+    for source in find_sources(root):
+        st = os.stat(os.path.join(root, source))
+        sources[source] = {
+            "hash": file_hash(os.path.join(root, source)),
+            "bytes": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+        }
+
+    if not force and os.path.exists(manifest_path) and os.path.exists(data_path):
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as fp:
+                old = json.load(fp)
+            old_hashes = {source: info["hash"] for source, info in old.get("sources", {}).items()}
+            if old.get("version") == BUNDLE_VERSION and old_hashes == {source: info["hash"] for source, info in sources.items()}:
+                return False
+        except (ValueError, KeyError):
+            pass
+
+    os.makedirs(os.path.dirname(data_path), exist_ok=True)
+
+    entries: Dict[str, Dict[str, Any]] = {}
+    animations: Dict[str, List[str]] = {}
+
+    with open(data_path + ".tmp", "wb") as fp:
+        for source in sources:
+            frames = decode_source(os.path.join(root, source))
+            is_animation = source.lower().endswith(".gif")
+            names = []
+
+            for i, (pixels, size, duration) in enumerate(frames):
+                padding = -fp.tell() % BUNDLE_ALIGNMENT
+                fp.write(b"\0" * padding)
+
+                name = f"{source}#{i}" if is_animation else source
+                entries[name] = {
+                    "source": source,
+                    "offset": fp.tell(),
+                    "length": len(pixels),
+                    "size": list(size),
+                    "format": "RGBA",
+                }
+                if duration is not None:
+                    entries[name]["duration"] = duration
+
+                fp.write(pixels)
+                names.append(name)
+
+            if is_animation:
+                animations[source] = names
+
+    manifest = {"version": BUNDLE_VERSION, "sources": sources, "entries": entries, "animations": animations}
+    with open(manifest_path + ".tmp", "w", encoding="utf-8") as fp:
+        json.dump(manifest, fp, indent=1)
+
+    os.replace(data_path + ".tmp", data_path)
+    os.replace(manifest_path + ".tmp", manifest_path)
+    return True
+
+
+if __name__ == "__main__":
+    """
+    Rebuilds the asset bundle if any source image changed.
+    """
+    import sys
+
+    rebuilt = build_bundle(force="--force" in sys.argv)
+    print("Bundle rebuilt." if rebuilt else "Bundle is up to date.")
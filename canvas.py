@@ -0,0 +1,143 @@
+from typing import Optional, Tuple
+
+import pygame
+
+from utils import (
+    singleton,
+    VIRTUAL_CANVAS_MODE,
+    VIRTUAL_CANVAS_SIZE,
+    VIRTUAL_CANVAS_SMOOTH
+)
+
+
+@singleton
+class VirtualCanvas:
+    """
+    Fixed logical-resolution surface the UI is laid out and drawn on.
+
+    present() scales the canvas onto the window in a single pass, letterboxed to keep its
+    aspect ratio, so the layout and every scaled asset are built once for the canvas size and
+    stay valid whatever the window size is. Mouse positions from the window are mapped back
+    with translate() and mouse_pos().
+
+    When disabled, attach() returns the display itself and every other method is a no-op,
+    so callers do not have to check which mode is active.
+    """
+
+    def __init__(self, size: Tuple[int, int] = VIRTUAL_CANVAS_SIZE, enabled: bool = bool(VIRTUAL_CANVAS_MODE), smooth: bool = bool(VIRTUAL_CANVAS_SMOOTH)):
+        self.size = (int(size[0]), int(size[1]))
+        self.enabled = enabled
+        self.smooth = smooth
+
+        self.surface: Optional[pygame.Surface] = None
+        self.display: Optional[pygame.Surface] = None
+        self.viewport = pygame.Rect((0, 0), self.size)
+        self._target: Optional[pygame.Surface] = None
+
+    def attach(self, display: pygame.Surface) -> pygame.Surface:
+        """
+        Targets a new display surface, e.g. after pygame.display.set_mode().
+
+        Args:
+            display (pygame.Surface): The window surface.
+
+        Returns:
+            pygame.Surface: The surface to draw the UI on: the canvas, or the display if disabled.
+        """
+        self.display = display
+        if not self.enabled:
+            return display
+
+        # Matching the display format keeps the final scale pass a straight copy per pixel.
+        self.surface = self.surface.convert() if self.surface is not None else pygame.Surface(self.size).convert()
+
+        width, height = display.get_size()
+        scale = min(width / self.size[0], height / self.size[1])
+        self.viewport = pygame.Rect(0, 0, round(self.size[0] * scale), round(self.size[1] * scale))
+        self.viewport.center = (width // 2, height // 2)
+
+        display.fill((0, 0, 0))
+        self._target = display.subsurface(self.viewport)
+        return self.surface
+
+    def present(self) -> None:
+        """
+        Scales the canvas onto the display. The caller still flips or updates the display.
+        """
+        if not self.enabled or self.display is None:
+            return
+
+        if self.viewport.size == self.size:
+            self._target.blit(self.surface, (0, 0))
+        elif self.smooth and self.display.get_bitsize() in (24, 32):
+            pygame.transform.smoothscale(self.surface, self.viewport.size, self._target)
+        else:
+            pygame.transform.scale(self.surface, self.viewport.size, self._target)
+
+    def to_canvas(self, pos: Tuple[int, int]) -> Tuple[int, int]:
+        """
+        Maps a window position to canvas coordinates; positions on the letterbox bars map outside the canvas.
+        """
+        if not self.enabled:
+            return pos
+        return (
+            (pos[0] - self.viewport.x) * self.size[0] // self.viewport.width,
+            (pos[1] - self.viewport.y) * self.size[1] // self.viewport.height,
+        )
+
+    def to_display(self, rect: pygame.Rect) -> pygame.Rect:
+        """
+        Maps a canvas rect to the window area it covers after present(), for partial display updates.
+        """
+        if not self.enabled:
+            return rect
+
+        left = self.viewport.x + rect.left * self.viewport.width // self.size[0]
+        top = self.viewport.y + rect.top * self.viewport.height // self.size[1]
+        right = self.viewport.x - (-rect.right * self.viewport.width // self.size[0])
+        bottom = self.viewport.y - (-rect.bottom * self.viewport.height // self.size[1])
+
+        # Smooth scaling blends neighbouring pixels, so changes bleed one pixel past the mapped edges.
+        return pygame.Rect(left, top, right - left, bottom - top).inflate(2, 2).clip(self.viewport)
+
+    def translate(self, event: pygame.event.Event) -> pygame.event.Event:
+        """
+        Returns the event with its mouse position in canvas coordinates.
+        """
+        if not self.enabled or "pos" not in event.dict:
+            return event
+
+        attrs = dict(event.dict, pos=self.to_canvas(event.pos))
+        if "rel" in attrs:
+            attrs["rel"] = (
+                event.rel[0] * self.size[0] // self.viewport.width,
+                event.rel[1] * self.size[1] // self.viewport.height,
+            )
+        return pygame.event.Event(event.type, attrs)
+
+    def mouse_pos(self) -> Tuple[int, int]:
+        """
+        Returns pygame.mouse.get_pos() in canvas coordinates.
+        """
+        return self.to_canvas(pygame.mouse.get_pos())
+
+
+if __name__ == "__main__":
+    """
+    Debugging and manual testing block.
+    """
+    pygame.init()
+    canvas = VirtualCanvas(enabled=True)
+
+    screen = canvas.attach(pygame.display.set_mode((1600, 1000)))
+    screen.fill((40, 40, 40))
+    pygame.draw.rect(screen, (232, 232, 232), (600, 320, 80, 80))
+    canvas.present()
+    pygame.display.flip()
+
+    print("viewport", canvas.viewport)
+    print("window (800, 500) -> canvas", canvas.to_canvas((800, 500)))
+    print("canvas rect -> window", canvas.to_display(pygame.Rect(600, 320, 80, 80)))
+
+    pygame.time.wait(1000)
+    pygame.quit()
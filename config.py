@@ -1,19 +1,209 @@
-from typing import Dict, Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple, Any, Callable
 from log import TRACE_LOG
-from utils import eLogLevel, eDirType
+from utils import eLogLevel, eDirType, CONFIG_SAVE_DELAY, CONFIG_WATCH_INTERVAL_MS
+import atexit
 import os
+import sys
+import time
 from file_manager import FileManager
 
+TRUE_VALUES = {"true", "1", "yes", "on"}
+FALSE_VALUES = {"false", "0", "no", "off"}
+
+
+class ConfigOption:
+    """
+    Schema entry describing a single config key.
+
+    Attributes:
+        default (Any): Typed value used when the key is missing or invalid.
+        parse (Callable[[List[str]], Any]): Converts the raw string values into the typed value.
+            Raises ValueError if the values are invalid.
+        serialize (Callable[[Any], List[str]]): Converts a typed value back into string values.
+    """
+
+    def __init__(self, default: Any, parse: Callable[[List[str]], Any], serialize: Callable[[Any], List[str]]):
+        self.default = default
+        self.parse = parse
+        self.serialize = serialize
+
+
+def parse_bool(values: List[str]) -> bool:
+    if len(values) != 1:
+        raise ValueError(f"expected a single value, got {values}")
+
+    value = values[0].lower()
+    if value in TRUE_VALUES:
+        return True
+    if value in FALSE_VALUES:
+        return False
+    raise ValueError(f"not a boolean: {values[0]}")
+
+
+def serialize_bool(value: bool) -> List[str]:
+    return ["true" if value else "false"]
+
+
+def parse_volume(values: List[str]) -> int:
+    if len(values) != 1 or not values[0].isdigit():
+        raise ValueError(f"not a volume level: {values}")
+    return max(0, min(100, int(values[0])))
+
+
+def serialize_volume(value: int) -> List[str]:
+    return [str(max(0, min(100, value)))]
+
+
+def parse_resolution(values: List[str]) -> Tuple[int, int]:
+    if len(values) != 2 or not all(v.isdigit() for v in values):
+        raise ValueError(f"not a resolution: {values}")
+    return int(values[0]), int(values[1])
+
+
+def serialize_resolution(value: Tuple[int, int]) -> List[str]:
+    return [str(value[0]), str(value[1])]
+
+
+config_schema: Dict[str, ConfigOption] = {
+    "resolution": ConfigOption((1080, 768), parse_resolution, serialize_resolution),
+    "volume": ConfigOption(100, parse_volume, serialize_volume),
+    "fullscreen": ConfigOption(False, parse_bool, serialize_bool),
+    "animated_background": ConfigOption(True, parse_bool, serialize_bool),
+}
+"""Maps known config keys to their type, default and validation."""
+
+
+ConfigCallback = Callable[[str, Any], None]
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+
+
+def _inotify_watch(directory: str) -> Optional[int]:
+    """
+    Opens a non-blocking inotify descriptor watching a directory for written or replaced files.
+
+    Returns:
+        Optional[int]: The inotify file descriptor, or None if inotify is not available.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+
+    import ctypes
+
+    try:
+        # The process already has libc loaded; CDLL(None) resolves against it without
+        # ctypes.util.find_library(), which shells out to ldconfig.
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return None
+
+        wd = libc.inotify_add_watch(fd, os.fsencode(directory), IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE)
+        if wd < 0:
+            os.close(fd)
+            return None
+        return fd
+
+    except (OSError, AttributeError):
+        return None
+
+
+class ConfigWatcher:
+    """
+    Detects changes of the config file on disk.
+
+    The file is checked at most once per interval. On Linux an inotify descriptor on the
+    config directory gates the check, so the file is only stat'ed after something was
+    written there; elsewhere the mtime and size are compared on every check.
+    """
+
+    def __init__(self, full_path: str, interval_ms: int = CONFIG_WATCH_INTERVAL_MS):
+        self.full_path = full_path
+        self.interval = interval_ms / 1000.0
+
+        self._next_check: float = 0.0
+        self._signature: Optional[Tuple[int, int]] = None
+        self._inotify_fd: Optional[int] = _inotify_watch(os.path.dirname(os.path.abspath(full_path)))
+
+        self.sync()
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.full_path)
+            return st.st_mtime_ns, st.st_size
+        except OSError:
+            return None
+
+    def sync(self) -> None:
+        """
+        Records the current state of the file as seen, e.g. after writing it ourselves.
+        """
+        self._signature = self._stat()
+
+    def changed(self) -> bool:
+        """
+        Returns True if the file changed since the last check or sync().
+        """
+        now = time.monotonic()
+        if now < self._next_check:
+            return False
+        self._next_check = now + self.interval
+
+        if self._inotify_fd is not None:
+            try:
+                os.read(self._inotify_fd, 4096)
+            except BlockingIOError:
+                return False
+            except OSError:
+                os.close(self._inotify_fd)
+                self._inotify_fd = None
+
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            return False
+
+        self._signature = signature
+        return True
+
+    @property
+    def next_check(self) -> float:
+        """Monotonic time of the next check that can detect a change."""
+        return self._next_check
+
+    def close(self) -> None:
+        if self._inotify_fd is not None:
+            os.close(self._inotify_fd)
+            self._inotify_fd = None
+
+
 class Config:
     """
     Configuration parser for key=value pairs from config.cfg.
+
+    Values of keys declared in config_schema are parsed once into typed values and cached
+    until the key is changed through set(). Callbacks registered with subscribe() are called
+    whenever the typed value of a key changes.
+
+    When save_delay is set, save() only marks the config dirty; the file is written once
+    the settings have been quiet for save_delay seconds (see update()), on flush() or at exit.
     """
 
-    def __init__(self, config_name: str, config_path: Optional[str] = "../config"):
+    def __init__(self, config_name: str, config_path: Optional[str] = "../config", save_delay: Optional[float] = CONFIG_SAVE_DELAY):
         self._config_settings: Dict[str, List[str]] = {}
         self._config_name: str = config_name
         self._config_path: str = config_path
 
+        self._values: Dict[str, Any] = {}
+        self._subscribers: Dict[str, List[ConfigCallback]] = {}
+
+        self.save_delay: Optional[float] = save_delay
+        self._dirty: bool = False
+        self._save_deadline: float = 0.0
+
+        self._watcher: Optional[ConfigWatcher] = None
+
         fileMgr = FileManager()
         fileMgr.set_working_path(eDirType.DIR_TYPE_CONFIG)
         fileMgr.create_file(config_name)
@@ -21,6 +211,8 @@ class Config:
         self._load_config()
         self._apply_defaults()
 
+        atexit.register(self.flush)
+
 
     def _apply_defaults(self):
         """
@@ -28,46 +220,33 @@ class Config:
         Adds default values for missing or invalid entries.
         """
 
-        res = self._config_settings.get("resolution")
-        vol = self._config_settings.get("volume")
-        f_screen = self._config_settings.get("fullscreen")
-        animated_bg = self._config_settings.get("animated_background")
-
-        if not res or len(res) != 2 or not all(r.isdigit() for r in res):
-            self.resolution = (1080, 768)
-            TRACE_LOG(eLogLevel.LOG_LEVEL_WARNING, f"[Config] Setting default resolution: {self.resolution[0]}x{self.resolution[1]}")
-
-        if not vol or len(vol) != 1 or not vol[0].isdigit():
-            self.volume = 100
-            TRACE_LOG(eLogLevel.LOG_LEVEL_WARNING, f"[Config] Setting default volume: {self.volume}")
+        changed = False
 
-        if not f_screen or len(f_screen) != 1 or f_screen[0].lower() not in {"true", "false", "1", "0", "yes", "no", "on", "off"}:
-            self.fullscreen = False
-            TRACE_LOG(eLogLevel.LOG_LEVEL_WARNING, f"[Config] Setting default fullscreen: {self.fullscreen}")
+        for key, option in config_schema.items():
+            values = self._config_settings.get(key)
 
-        if not animated_bg or len(animated_bg) != 1 or animated_bg[0].lower() not in {"true", "false", "1", "0", "yes", "no", "on", "off"}:
-            self.animated_bg = True
-            TRACE_LOG(eLogLevel.LOG_LEVEL_WARNING, f"[Config] Setting default animated_background: {self.animated_bg}")
-
-        self.save()
+            try:
+                if values is None:
+                    raise ValueError("missing")
+                option.parse(values)
+            except ValueError:
+                self.set_value(key, option.default)
+                changed = True
+                TRACE_LOG(eLogLevel.LOG_LEVEL_WARNING, f"[Config] Setting default {key}: {','.join(option.serialize(option.default))}")
 
-    @property
-    def resolution(self) -> Optional[Tuple[int, int]]:
-        """
-        Returns the resolution setting as a list of strings.
+        if changed:
+            self.save()
 
-        Example: ["1920", "1080"]
+    def _read_settings(self) -> Optional[Dict[str, List[str]]]:
         """
-        if self._config_settings and "resolution" in self._config_settings:
-            return self._config_settings["resolution"]
-        return None
+        Reads the config file and parses its contents into a dictionary.
 
-    def _load_config(self) -> bool:
-        """
-        Loads the config file and parses its contents into a dictionary.
+        Returns:
+            Optional[Dict[str, List[str]]]: Parsed settings, or None if the file could not be read.
         """
 
         full_path = os.path.join(self._config_path, self._config_name)
+        settings: Dict[str, List[str]] = {}
 
         try:
             with open(full_path, "r", encoding="utf-8") as fp:
@@ -80,82 +259,265 @@ class Config:
 
                     if '=' in line:
                         key, value = line.split('=', 1)
-                        self._config_settings[key.strip()] = [
+                        settings[key.strip()] = [
                             v.strip() for v in value.split(",")
                         ]
-            return True
+            return settings
 
         except FileNotFoundError:
             TRACE_LOG(eLogLevel.LOG_LEVEL_ERROR, f"[Config] File not found: {full_path}")
 
         except Exception as err:
             TRACE_LOG(eLogLevel.LOG_LEVEL_ERROR, f"[Config] Failed to load: {err}")
-        return False
+        return None
+
+    def _load_config(self) -> bool:
+        """
+        Loads the config file and parses its contents into a dictionary.
+        """
+
+        settings = self._read_settings()
+        if settings is None:
+            return False
+
+        self._config_settings.update(settings)
+        self._values.clear()
+        return True
+
+    def reload(self) -> List[str]:
+        """
+        Re-reads the config file and applies only the keys whose values differ,
+        so subscribers are notified just for what actually changed.
+
+        Returns:
+            List[str]: Keys that were changed.
+        """
+        settings = self._read_settings()
+        if settings is None:
+            return []
+
+        changed = [key for key, values in settings.items() if self._config_settings.get(key) != values]
+
+        for key in changed:
+            values = settings[key]
+            option = config_schema.get(key)
+
+            if option is not None:
+                try:
+                    option.parse(values)
+                except ValueError:
+                    TRACE_LOG(eLogLevel.LOG_LEVEL_WARNING, f"[Config] Ignoring invalid {key} on reload: {','.join(values)}")
+                    continue
+
+            self.set(key, values)
+
+        if changed:
+            TRACE_LOG(eLogLevel.LOG_LEVEL_LOG, f"[Config] Reloaded: {', '.join(changed)}")
+        return changed
+
+    def watch(self, interval_ms: int = CONFIG_WATCH_INTERVAL_MS) -> None:
+        """
+        Enables hot-reloading: update() checks the config file for external changes at most
+        once every interval_ms milliseconds and reloads it when it changed.
+
+        Args:
+            interval_ms (int): Minimum time between two checks.
+        """
+        if self._watcher is not None:
+            self._watcher.close()
+
+        self._watcher = ConfigWatcher(os.path.join(self._config_path, self._config_name), interval_ms)
+
+    def unwatch(self) -> None:
+        if self._watcher is not None:
+            self._watcher.close()
+            self._watcher = None
+
+    def get(self, key: str) -> Any:
+        """
+        Returns the typed value of a schema key, parsing it only on first access after a change.
+
+        Args:
+            key (str): A key declared in config_schema.
+
+        Returns:
+            Any: The parsed value, or the schema default if the stored value is invalid.
+        """
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+
+        option = config_schema[key]
+        values = self._config_settings.get(key)
+
+        if values is None:
+            value = option.default
+        else:
+            try:
+                value = option.parse(values)
+            except ValueError:
+                TRACE_LOG(eLogLevel.LOG_LEVEL_WARNING, f"[Config] Invalid {key} values.")
+                value = option.default
+
+        self._values[key] = value
+        return value
+
+    def set_value(self, key: str, value: Any) -> None:
+        """
+        Updates a schema key from its typed value.
+
+        Args:
+            key (str): A key declared in config_schema.
+            value (Any): The new typed value.
+        """
+        self.set(key, config_schema[key].serialize(value))
+
+    def subscribe(self, key: str, callback: ConfigCallback) -> None:
+        """
+        Registers a callback that is called with (key, new_value) when the value of key changes.
+
+        Args:
+            key (str): The config key to watch.
+            callback (ConfigCallback): Function to call on change.
+        """
+        self._subscribers.setdefault(key, []).append(callback)
+
+    def unsubscribe(self, key: str, callback: ConfigCallback) -> None:
+        callbacks = self._subscribers.get(key)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
 
     @property
     def resolution(self) -> Optional[Tuple[int, int]]:
         """
         Returns the resolution as a tuple of integers (e.g. 1920, 1080).
         """
-        values = self._config_settings.get("resolution")
-        if values and len(values) == 2:
-            try:
-                return int(values[0]), int(values[1])
-            except ValueError:
-                TRACE_LOG(eLogLevel.LOG_LEVEL_WARNING, "[Config] Invalid resolution values.")
-        return None
+        return self.get("resolution")
 
     @property
     def fullscreen(self) -> bool:
         """
         Returns whether fullscreen is enabled.
         """
-        val = self._config_settings.get("fullscreen", ["false"])[0].lower()
-        return val in {"true", "1", "yes", "on"}
+        return self.get("fullscreen")
 
     @property
     def animated_background(self) -> bool:
         """
         Returns whether animated_background is enabled.
         """
-        val = self._config_settings.get("animated_background", ["false"])[0].lower()
-        return val in {"true", "1", "yes", "on"}
+        return self.get("animated_background")
 
     @property
     def volume(self) -> int:
         """
         Returns the volume level (0–100), defaults to 100.
         """
-        val = self._config_settings.get("volume", ["100"])[0]
-        try:
-            return max(0, min(100, int(val)))
-        except ValueError:
-            TRACE_LOG(eLogLevel.LOG_LEVEL_WARNING, "[Config] Invalid volume value.")
-            return 100
+        return self.get("volume")
 
     def set(self, key: str, values: List[str]) -> None:
         """
         Updates a key in the config dictionary.
 
+        Invalidates the cached typed value of the key and notifies its subscribers
+        if the typed value changed.
+
         Args:
             key (str): The config key to update.
             values (List[str]): List of string values to store.
         """
+        if key not in config_schema:
+            self._config_settings[key] = values
+            return
+
+        callbacks = self._subscribers.get(key)
+        old_value = self.get(key) if callbacks else None
+
         self._config_settings[key] = values
+        self._values.pop(key, None)
+
+        if callbacks:
+            new_value = self.get(key)
+            if new_value != old_value:
+                for callback in list(callbacks):
+                    callback(key, new_value)
 
-    def save(self) -> bool:
+    def save(self, immediate: bool = False) -> bool:
         """
         Writes current config back to the config file.
 
+        With a save_delay set the write is deferred: the config is marked dirty and
+        written by update() once no further save was requested for save_delay seconds.
+
+        Args:
+            immediate (bool): Write right away even if saving is deferred.
+
+        Returns:
+            bool: True if saved (or scheduled) successfully.
+        """
+        self._dirty = True
+
+        if immediate or self.save_delay is None:
+            return self.flush()
+
+        self._save_deadline = time.monotonic() + self.save_delay
+        return True
+
+    def update(self) -> None:
+        """
+        Writes a pending deferred save once its quiet period has elapsed and, when watching,
+        reloads the config file if it was changed externally.
+        Meant to be called once per frame.
+        """
+        if self._dirty and time.monotonic() >= self._save_deadline:
+            self.flush()
+
+        if self._watcher is not None and self._watcher.changed():
+            self.reload()
+
+    def next_update(self) -> Optional[float]:
+        """
+        Returns the monotonic time at which update() has work to do next, so an idle loop
+        knows how long it may sleep.
+
+        Returns:
+            Optional[float]: Time of the pending save or the next file check, or None if neither is due.
+        """
+        deadlines = []
+        if self._dirty:
+            deadlines.append(self._save_deadline)
+        if self._watcher is not None:
+            deadlines.append(self._watcher.next_check)
+        return min(deadlines) if deadlines else None
+
+    def flush(self) -> bool:
+        """
+        Writes pending changes to the config file, if there are any.
+
+        The file is written to a temporary file first and then atomically renamed over
+        the config, so a crash can never leave a half-written config behind.
+
         Returns:
-            bool: True if saved successfully.
+            bool: True if nothing was pending or the config was saved successfully.
         """
+        if not self._dirty:
+            return True
+
         full_path = os.path.join(self._config_path, self._config_name)
+        tmp_path = full_path + ".tmp"
 
         try:
-            with open(full_path, "w", encoding="utf-8") as fp:
+            with open(tmp_path, "w", encoding="utf-8") as fp:
                 for key, values in self._config_settings.items():
                     fp.write(f"{key} = {','.join(values)}\n")
+                fp.flush()
+                os.fsync(fp.fileno())
+            os.replace(tmp_path, full_path)
+
+            self._dirty = False
+            if self._watcher is not None:
+                self._watcher.sync()
             TRACE_LOG(eLogLevel.LOG_LEVEL_LOG, f"[Config] Saved: {full_path}")
             return True
         except Exception as e:
@@ -170,16 +532,16 @@ class Config:
         Args:
             res (Tuple[int, int]): (width, height)
         """
-        self.set("resolution", [str(res[0]), str(res[1])])
+        self.set_value("resolution", res)
 
     @fullscreen.setter
     def fullscreen(self, enabled: bool):
-        self.set("fullscreen", ["true" if enabled else "false"])
+        self.set_value("fullscreen", enabled)
 
     @animated_background.setter
     def animated_background(self, enabled: bool):
-        self.set("animated_background", ["true" if enabled else "false"])
+        self.set_value("animated_background", enabled)
 
     @volume.setter
     def volume(self, level: int):
-        self.set("volume", [str(max(0, min(100, level)))])
\ No newline at end of file
+        self.set_value("volume", level)
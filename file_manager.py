@@ -1,9 +1,181 @@
 import os
+import atexit
+import mmap
+import threading
 import utils
-from typing import TypeAlias, Optional, Union
+from collections import OrderedDict
+from typing import TypeAlias, Optional, Union, TextIO, Iterator, Iterable
 
 eDir: TypeAlias = utils.eDirType
 
+
+class FileHandlePool:
+    """
+    Bounded LRU pool of open file handles keyed by full path.
+
+    Handles are opened in "a+" mode so the same handle serves appends and reads.
+    The least recently used handle is closed once the pool exceeds its size.
+    """
+
+    def __init__(self, max_size: int = utils.FILE_POOL_SIZE):
+        self.max_size = max_size
+        self._handles: "OrderedDict[str, TextIO]" = OrderedDict()
+        self.lock = threading.RLock()
+
+    def get(self, full_path: str) -> TextIO:
+        """
+        Returns an open handle for the given path, opening it if needed.
+
+        Must be called with the pool lock held.
+
+        Args:
+            full_path (str): Absolute path of the file.
+
+        Returns:
+            TextIO: Handle opened in "a+" mode.
+        """
+        fp = self._handles.get(full_path)
+        if fp is not None:
+            self._handles.move_to_end(full_path)
+            return fp
+
+        fp = open(full_path, "a+", encoding="utf-8")
+        self._handles[full_path] = fp
+
+        while len(self._handles) > self.max_size:
+            _, oldest = self._handles.popitem(last=False)
+            oldest.close()
+
+        return fp
+
+    def __contains__(self, full_path: str) -> bool:
+        return full_path in self._handles
+
+    def flush(self, full_paths: Optional[Iterable[str]] = None) -> None:
+        with self.lock:
+            if full_paths is None:
+                handles = list(self._handles.values())
+            else:
+                handles = [self._handles[path] for path in full_paths if path in self._handles]
+
+            for fp in handles:
+                fp.flush()
+
+    def close(self, full_path: str) -> None:
+        with self.lock:
+            fp = self._handles.pop(full_path, None)
+            if fp is not None:
+                fp.close()
+
+    def close_all(self) -> None:
+        with self.lock:
+            while self._handles:
+                _, fp = self._handles.popitem(last=False)
+                try:
+                    fp.close()
+                except Exception as err:
+                    print(f"There was an issue while closing the file: {err}")
+
+
+_handle_pool = FileHandlePool()
+atexit.register(_handle_pool.close_all)
+
+
+class MappedFile:
+    """
+    Read-only memory-mapped view of a file.
+
+    Searching and tailing work directly on the mapping, so only the touched pages
+    are loaded regardless of the file size. Use as a context manager or call close().
+    """
+
+    def __init__(self, full_path: str, encoding: str = "utf-8"):
+        self.full_path = full_path
+        self.encoding = encoding
+
+        self._fp = open(full_path, "rb")
+        self._map: Optional[mmap.mmap] = None
+
+        if os.fstat(self._fp.fileno()).st_size > 0:
+            self._map = mmap.mmap(self._fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __enter__(self) -> "MappedFile":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._map) if self._map is not None else 0
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._fp.close()
+
+    def read(self, offset: int, length: int) -> bytes:
+        """
+        Returns up to length bytes starting at offset.
+        """
+        if self._map is None:
+            return b""
+        return self._map[offset:offset + length]
+
+    def find(self, needle: Union[str, bytes], start: int = 0) -> int:
+        """
+        Returns the byte offset of the first occurrence of needle at or after start, or -1.
+        """
+        if self._map is None:
+            return -1
+        if isinstance(needle, str):
+            needle = needle.encode(self.encoding)
+        return self._map.find(needle, start)
+
+    def find_all(self, needle: Union[str, bytes]) -> Iterator[int]:
+        """
+        Yields the byte offset of every occurrence of needle.
+        """
+        if isinstance(needle, str):
+            needle = needle.encode(self.encoding)
+
+        offset = self.find(needle)
+        while offset != -1:
+            yield offset
+            offset = self.find(needle, offset + len(needle))
+
+    def line_at(self, offset: int) -> str:
+        """
+        Returns the full line containing the given byte offset.
+        """
+        if self._map is None:
+            return ""
+        start = self._map.rfind(b"\n", 0, offset) + 1
+        end = self._map.find(b"\n", offset)
+        if end == -1:
+            end = len(self._map)
+        return self._map[start:end].decode(self.encoding, errors="replace")
+
+    def tail(self, count: int) -> list[str]:
+        """
+        Returns the last count lines, scanning backwards from the end of the file.
+        """
+        if self._map is None or count <= 0:
+            return []
+
+        end = len(self._map)
+        if self._map[end - 1:end] == b"\n":
+            end -= 1
+
+        start = end
+        for _ in range(count):
+            start = self._map.rfind(b"\n", 0, start)
+            if start == -1:
+                break
+
+        data = self._map[start + 1:end]
+        return [line + "\n" for line in data.decode(self.encoding, errors="replace").split("\n")]
+
 class FileManager:
     """
     Singleton class that handles file operations such as reading, writing and creating files
@@ -11,11 +183,14 @@ class FileManager:
     
     Class Attributes:
         working_dir (str): Path to the current working directory.
+        pool (FileHandlePool): Open handles shared by all instances.
     
     Instance Attributes:
         _file_name (str): Last file name used by the instance.
     """
 
+    pool: FileHandlePool = _handle_pool
+
     def __init__(self):
         """
         Initializes the FileManager instance.
@@ -44,6 +219,7 @@ class FileManager:
         print(full_path)
 
         try:
+            self.pool.close(full_path)
             with open(full_path, "w") as fp:
                 fp.write("")
             self._file_name = full_path
@@ -68,22 +244,120 @@ class FileManager:
 
         full_path = os.path.join(self.working_dir, file_name)
 
-        content = []
+        try:
+            with self.pool.lock:
+                if full_path not in self.pool and not os.path.exists(full_path):
+                    raise FileNotFoundError(f"No such file: '{full_path}'")
+
+                fp = self.pool.get(full_path)
+                fp.flush()
+                fp.seek(0)
+                return fp.readlines()
+
+        except Exception as err:
+            print(f"There was an issue while reading the file: {err}")
+            return None
+
+    @utils.require_conditions(check_class_attr="working_dir", check_args_not_null=True)
+    def iter_lines(self, file_name: str) -> Iterator[str]:
+        """
+        Lazily yields the lines of a file without loading the whole file into memory.
+
+        Args:
+            file_name (str): Name of the file to read.
+
+        Yields:
+            str: One line of the file, including its line break.
+        """
+
+        full_path = os.path.join(self.working_dir, file_name)
+        self._flush_pooled(full_path)
 
         try:
-            with open(full_path, "r") as fp:
-                content = fp.readlines()
-                return content
+            with open(full_path, "r", encoding="utf-8", errors="replace") as fp:
+                yield from fp
+
+        except Exception as err:
+            print(f"There was an issue while reading the file: {err}")
+
+    @utils.require_conditions(check_class_attr="working_dir", check_args_not_null=True)
+    def read_range(self, file_name: str, offset: int, length: int) -> Optional[bytes]:
+        """
+        Reads a byte range of a file.
+
+        Args:
+            file_name (str): Name of the file to read.
+            offset (int): Byte offset to start reading at.
+            length (int): Maximum number of bytes to read.
+
+        Returns:
+            Optional[bytes]: The bytes read, or None if reading failed.
+        """
+
+        full_path = os.path.join(self.working_dir, file_name)
+        self._flush_pooled(full_path)
+
+        try:
+            with open(full_path, "rb") as fp:
+                fp.seek(offset)
+                return fp.read(length)
 
         except Exception as err:
             print(f"There was an issue while reading the file: {err}")
             return None
 
+    @utils.require_conditions(check_class_attr="working_dir", check_args_not_null=True)
+    def open_mapped(self, file_name: str) -> Optional[MappedFile]:
+        """
+        Opens a read-only memory-mapped view of a file for searching or tailing.
+
+        Args:
+            file_name (str): Name of the file to map.
+
+        Returns:
+            Optional[MappedFile]: The mapped file, or None if mapping failed.
+        """
+
+        full_path = os.path.join(self.working_dir, file_name)
+        self._flush_pooled(full_path)
+
+        try:
+            return MappedFile(full_path)
+
+        except Exception as err:
+            print(f"There was an issue while mapping the file: {err}")
+            return None
+
+    def tail(self, file_name: str, count: int = 10) -> list[str]:
+        """
+        Returns the last count lines of a file using a memory-mapped view.
+
+        Args:
+            file_name (str): Name of the file to read.
+            count (int): Number of lines to return.
+
+        Returns:
+            list[str]: Up to count lines from the end of the file.
+        """
+        mapped = self.open_mapped(file_name)
+        if mapped is None:
+            return []
+
+        with mapped:
+            return mapped.tail(count)
+
+    def _flush_pooled(self, full_path: str) -> None:
+        with self.pool.lock:
+            if full_path in self.pool:
+                self.pool.get(full_path).flush()
+
     @utils.require_conditions(check_class_attr="working_dir", check_args_not_null=True)
     def write_file(self, file_name: str, content: Union[str, list[str]]) -> bool:
         """
         Appends content to a file in the current working directory.
 
+        The handle stays open in the pool; call flush() to force the data to disk.
+
         Args:
             file_name (str): Name of the file to write to.
             content (Union[str, list[str]]): Content to write. Can be a single string or a list of lines.
@@ -94,7 +368,8 @@ class FileManager:
 
         full_path = os.path.join(self.working_dir, file_name)
         try:
-            with open(full_path, "a", encoding="utf-8") as f:
+            with self.pool.lock:
+                f = self.pool.get(full_path)
                 if isinstance(content, list):
                     f.writelines(
                         line if line.endswith("\n") else line + "\n"
@@ -108,6 +383,26 @@ class FileManager:
             print(f"There was an issue while writing to the file: {err}")
             return False
 
+    def flush(self, *file_names: str) -> None:
+        """
+        Flushes the pooled handles of the given files in the working directory, or every
+        pooled handle if no file is given.
+
+        Args:
+            *file_names (str): Names of the files to flush.
+        """
+        if not file_names:
+            self.pool.flush()
+            return
+
+        self.pool.flush(os.path.join(self.working_dir, file_name) for file_name in file_names)
+
+    def close_all(self) -> None:
+        """
+        Flushes and closes every pooled file handle.
+        """
+        self.pool.close_all()
+
     def set_working_path(self, dir_type: Union[eDir, str]):
         root_path = utils.base_path()
         folder_name = utils.working_directories.get(dir_type)
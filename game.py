@@ -1,8 +1,15 @@
 from file_manager import FileManager
 from menu import Menu
+from scheduler import FrameScheduler
+from assets_manager import AssetsManager
+from profiler import Profiler
 
 from typing import Optional
 from log import TRACE_LOG
+from utils import FRAME_RATE, UPDATE_RATE, MAX_UPDATE_STEPS, IDLE_LOOP_MODE
+
+import time
+import pygame
 
 class Game:
     def __init__(self):
@@ -10,6 +17,10 @@ class Game:
 
         self.menu_instance = Menu()
         self.manager_instance = FileManager()
+
+        self.clock = pygame.time.Clock()
+        self.scheduler = FrameScheduler()
+        self.profiler = Profiler()
     
     def __repr__(self) -> str:
         return "Game(self):"
@@ -23,4 +34,45 @@ class Game:
         self._state = new_state
 
     def run(self):
-        self.menu_instance.build_menu()
+        """
+        Main loop with a fixed update step decoupled from rendering.
+
+        Updates run UPDATE_RATE times per second of real time regardless of the frame rate,
+        at most MAX_UPDATE_STEPS per frame so a long hitch cannot snowball. Rendering gets the
+        fraction of a step left over for interpolation, and the scheduler fills whatever
+        remains of the 1 / FRAME_RATE frame budget with low-priority work.
+        """
+        menu = self.menu_instance
+        menu.open()
+        menu.first_frame()
+
+        self.scheduler.add("autosave", lambda deadline: menu.config.update(), priority=1)
+        self.scheduler.add("asset_streaming", AssetsManager().poll_preloaders)
+
+        step = 1.0 / UPDATE_RATE
+        frame_budget = 1.0 / FRAME_RATE
+        accumulator = 0.0
+        previous = time.perf_counter()
+
+        while menu.running:
+            events = menu.wait_events() if IDLE_LOOP_MODE else None
+            with self.profiler.phase("events"):
+                for event in (pygame.event.get() if events is None else events):
+                    menu.handle_event(menu.canvas.translate(event))
+
+            frame_start = time.perf_counter()
+            accumulator += min(frame_start - previous, step * MAX_UPDATE_STEPS)
+            previous = frame_start
+
+            with self.profiler.phase("update"):
+                while accumulator >= step:
+                    menu.update(step)
+                    accumulator -= step
+
+            menu.render(accumulator / step)
+
+            with self.profiler.phase("scheduler"):
+                self.scheduler.run(frame_start + frame_budget)
+            self.clock.tick(FRAME_RATE)
+
+        pygame.quit()
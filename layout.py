@@ -0,0 +1,173 @@
+import math
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional, Tuple
+
+import pygame
+
+_EPSILON = 1e-9
+
+ScreenSize = Tuple[int, int]
+RectTable = Dict[str, pygame.Rect]
+"""Compiled rect per node name of one screen."""
+
+
+class Coord(NamedTuple):
+    """
+    One position or length of a layout node.
+
+    Evaluates to px + sw * screen width + sh * screen height + scale * ref, where ref is an
+    attribute of an earlier node of the same screen, written as "node.attr" (e.g. "volume_bar.right").
+    The screen fractions are floored, like the integer division of hand-written layout code,
+    and the total is rounded half away from zero, as pygame does with float coordinates.
+    """
+    px: float = 0
+    sw: float = 0.0
+    sh: float = 0.0
+    ref: Optional[str] = None
+    scale: float = 1.0
+
+
+def px(value: float) -> Coord:
+    return Coord(px=value)
+
+
+def screen(width: float = 0.0, height: float = 0.0, offset: float = 0) -> Coord:
+    """
+    A fraction of the screen width and/or height plus a fixed offset in pixels.
+    """
+    return Coord(px=offset, sw=width, sh=height)
+
+
+def ref(attr: str, scale: float = 1.0, offset: float = 0) -> Coord:
+    """
+    A scaled attribute of an earlier node plus a fixed offset in pixels.
+    """
+    return Coord(px=offset, ref=attr, scale=scale)
+
+
+class Node(NamedTuple):
+    """
+    Declarative placement of one element of a screen.
+
+    Attributes:
+        anchor (str): Rect attribute placed at `at`, e.g. "center", "midtop" or "topleft".
+        at (Tuple[Coord, Coord]): Position of the anchor.
+        image (Optional[str]): Asset whose natural size is the size of the node.
+        size (Optional[Tuple[Coord, Coord]]): Size to scale the image to; overrides the natural size.
+            Nodes with neither image nor size are points (zero-sized rects), e.g. text positions.
+    """
+    anchor: str = "center"
+    at: Tuple[Coord, Coord] = (Coord(), Coord())
+    image: Optional[str] = None
+    size: Optional[Tuple[Coord, Coord]] = None
+
+
+LayoutSpec = Dict[str, Node]
+"""Nodes of one screen in evaluation order; nodes may only refer to earlier ones."""
+
+
+def evaluate(coord: Coord, screen_size: ScreenSize, table: RectTable) -> int:
+    value = coord.px + math.floor(coord.sw * screen_size[0] + coord.sh * screen_size[1] + _EPSILON)
+
+    if coord.ref is not None:
+        name, _, attr = coord.ref.partition(".")
+        if name not in table:
+            raise ValueError(f"Layout reference to unknown or later node: {coord.ref}")
+        value += coord.scale * getattr(table[name], attr)
+
+    return int(math.copysign(math.floor(abs(value) + 0.5), value))
+
+
+def compile_layout(spec: LayoutSpec, screen_size: ScreenSize, image_size: Callable[[str], ScreenSize]) -> RectTable:
+    """
+    Computes the rect of every node of a screen at one resolution.
+
+    Args:
+        spec (LayoutSpec): Nodes of the screen.
+        screen_size (ScreenSize): Resolution to compile for.
+        image_size (Callable[[str], ScreenSize]): Returns the natural size of an image asset.
+
+    Returns:
+        RectTable: Rect per node name.
+    """
+    table: RectTable = {}
+
+    for name, node in spec.items():
+        if node.size is not None:
+            size = (evaluate(node.size[0], screen_size, table), evaluate(node.size[1], screen_size, table))
+        elif node.image is not None:
+            size = image_size(node.image)
+        else:
+            size = (0, 0)
+
+        rect = pygame.Rect((0, 0), size)
+        setattr(rect, node.anchor, (evaluate(node.at[0], screen_size, table), evaluate(node.at[1], screen_size, table)))
+        table[name] = rect
+
+    return table
+
+
+class Layout:
+    """
+    Layout of several screens, compiled into rect tables cached per resolution.
+
+    Image sizes are looked up once per asset, so compiling for another resolution is pure
+    arithmetic and switching resolution only swaps the table. The returned tables are
+    shared and must not be modified.
+    """
+
+    def __init__(self, screens: Dict[Any, LayoutSpec], image_size: Callable[[str], ScreenSize]):
+        self.screens = screens
+        self._image_size = image_size
+        self._image_sizes: Dict[str, ScreenSize] = {}
+        self._tables: Dict[ScreenSize, Dict[Any, RectTable]] = {}
+
+    def image_size(self, asset: str) -> ScreenSize:
+        size = self._image_sizes.get(asset)
+        if size is None:
+            size = self._image_sizes[asset] = tuple(self._image_size(asset))
+        return size
+
+    def precompile(self, resolutions: Iterable[ScreenSize]) -> None:
+        for resolution in resolutions:
+            self.tables(resolution)
+
+    def tables(self, resolution: ScreenSize) -> Dict[Any, RectTable]:
+        """
+        Returns the rect tables of every screen at a resolution, compiling them on first use.
+
+        Args:
+            resolution (ScreenSize): Screen size.
+
+        Returns:
+            Dict[Any, RectTable]: Rect table per screen.
+        """
+        resolution = (int(resolution[0]), int(resolution[1]))
+        tables = self._tables.get(resolution)
+
+        if tables is None:
+            tables = self._tables[resolution] = {
+                key: compile_layout(spec, resolution, self.image_size)
+                for key, spec in self.screens.items()
+            }
+        return tables
+
+    def clear(self) -> None:
+        self._image_sizes.clear()
+        self._tables.clear()
+
+
+if __name__ == "__main__":
+    """
+    Debugging and manual testing block.
+    """
+    spec = {
+        "title": Node("midtop", (screen(width=0.5), px(100)), size=(px(400), px(80))),
+        "button": Node("midtop", (ref("title.centerx"), ref("title.bottom", offset=20)), size=(px(160), px(48))),
+        "label": Node("topleft", (ref("button.left", 1.1), ref("button.bottom", 0.8))),
+    }
+
+    layout = Layout({"main": spec}, lambda asset: (0, 0))
+    layout.precompile([(1280, 720), (1920, 1080)])
+
+    for resolution in ((1280, 720), (1920, 1080)):
+        print(resolution, layout.tables(resolution)["main"])
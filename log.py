@@ -1,14 +1,21 @@
-from typing import Optional
+from typing import Optional, Dict, List, Tuple
 from datetime import datetime
 from file_manager import FileManager
 
+import atexit
+import queue
+import threading
+import time
+
 from utils import (
     singleton,
     eLogLevel,
     eFileType,
     eDirType,
     filename_from_enum,
-    format_enum
+    format_enum,
+    LOG_ASYNC_MODE,
+    LOG_FLUSH_INTERVAL
 )
 
 
@@ -17,18 +24,158 @@ def TRACE_LOG(level: Optional[eLogLevel], message: str):
     Log().log(level, message)
 
 
+file_type_map: Dict[eLogLevel, eFileType] = {
+    eLogLevel.LOG_LEVEL_LOG: eFileType.FILE_LOG,
+    eLogLevel.LOG_LEVEL_WARNING: eFileType.FILE_LOG,
+    eLogLevel.LOG_LEVEL_ERROR: eFileType.FILE_SYSERR,
+}
+"""Maps log levels to the file their records are written to."""
+
+
+LogRecord = Tuple[float, Optional[eLogLevel], str]
+
+
+def format_record(timestamp: float, level: Optional[eLogLevel], message: str) -> str:
+    """
+    Formats a log record into its final text representation.
+
+    Args:
+        timestamp (float): Time of the record as returned by time.time().
+        level (Optional[eLogLevel]): Severity level.
+        message (str): Message content.
+
+    Returns:
+        str: Formatted log line.
+    """
+    stamp = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+
+    if level is None:
+        return f"[{stamp}] {message}"
+    return f"[{stamp}] [{format_enum(level)}] -> {message}"
+
+
+class LogWriter(threading.Thread):
+    """
+    Background thread that drains queued log records in batches.
+
+    The log files stay open in the FileManager handle pool and are flushed once per batch,
+    so the thread calling TRACE_LOG only pays for a queue put.
+    """
+
+    def __init__(self, manager_instance: FileManager, flush_interval: float = LOG_FLUSH_INTERVAL):
+        """
+        Args:
+            manager_instance (FileManager): File manager pointed at the log directory.
+            flush_interval (float): Seconds between two batch writes.
+        """
+        super().__init__(name="LogWriter", daemon=True)
+        self.manager_instance = manager_instance
+        self.flush_interval = flush_interval
+
+        self._queue: "queue.SimpleQueue[LogRecord]" = queue.SimpleQueue()
+        self._stop_event = threading.Event()
+
+    def put(self, record: LogRecord) -> None:
+        self._queue.put(record)
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            self._stop_event.wait(self.flush_interval)
+            self._drain()
+
+        self._drain()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops the writer after the queue has been drained.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait for the thread to finish.
+        """
+        self._stop_event.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout)
+
+    def _drain(self) -> None:
+        batch: Dict[str, List[str]] = {}
+        console: List[str] = []
+
+        while True:
+            try:
+                timestamp, level, message = self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            formatted = format_record(timestamp, level, message)
+            file_type = file_type_map.get(level, eFileType.FILE_LOG)
+
+            batch.setdefault(filename_from_enum(file_type), []).append(formatted)
+            if level is not None and file_type != eFileType.FILE_LOG:
+                batch.setdefault(filename_from_enum(eFileType.FILE_LOG), []).append(formatted)
+
+            console.append(formatted)
+
+        if not console:
+            return
+
+        for file_name, lines in batch.items():
+            self.manager_instance.write_file(file_name, lines)
+        self.manager_instance.flush(*batch)
+
+        print("\n".join(console))
+
+
 @singleton
 class Log:
     """
     Log class that handles logging messages to files based on severity.
+
+    With LOG_ASYNC_MODE enabled records are only queued on the calling thread and written
+    by a LogWriter thread; otherwise every call writes synchronously.
     """
 
     def __init__(self):
         self._log_message: Optional[str] = None
+        self._last_record: Optional[LogRecord] = None
         self.manager_instance = FileManager()
         self.manager_instance.set_working_path(eDirType.DIR_TYPE_LOG)
         self.min_level = eLogLevel.LOG_LEVEL_LOG
 
+        self._writer: Optional[LogWriter] = None
+
+        if LOG_ASYNC_MODE:
+            self.start_async()
+
+    @property
+    def is_async(self) -> bool:
+        return self._writer is not None
+
+    def start_async(self, flush_interval: float = LOG_FLUSH_INTERVAL) -> None:
+        """
+        Switches the logger to queued mode and starts the background writer.
+
+        Args:
+            flush_interval (float): Seconds between two batch writes.
+        """
+        if self._writer is not None:
+            return
+
+        self._writer = LogWriter(self.manager_instance, flush_interval)
+        self._writer.start()
+        atexit.register(self.shutdown)
+
+    def shutdown(self) -> None:
+        """
+        Drains all queued records into the log files and returns to synchronous mode.
+        """
+        if self._writer is None:
+            return
+
+        writer = self._writer
+        self._writer = None
+        writer.stop()
+        atexit.unregister(self.shutdown)
+
     def log(self, level: Optional[eLogLevel], message: str) -> None:
         """
         Logs a message with an optional log level.
@@ -40,36 +187,39 @@ class Log:
         if level is not None and not isinstance(level, eLogLevel):
             raise ValueError("Invalid log level")
 
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if level is not None and level.value < self.min_level.value:
+            return
 
-        if level is None:
-            formatted = f"[{timestamp}] {message}"
-        else:
-            formatted = f"[{timestamp}] [{format_enum(level)}] -> {message}"
+        if self._writer is not None:
+            record = (time.time(), level, message)
+            self._writer.put(record)
+            self._last_record = record
+            self._log_message = None
+            return
 
-        file_type_map = {
-            eLogLevel.LOG_LEVEL_LOG: eFileType.FILE_LOG,
-            eLogLevel.LOG_LEVEL_WARNING: eFileType.FILE_LOG,
-            eLogLevel.LOG_LEVEL_ERROR: eFileType.FILE_SYSERR,
-        }
+        formatted = format_record(time.time(), level, message)
 
         file_type = file_type_map.get(level, eFileType.FILE_LOG)
         target_filename = filename_from_enum(file_type)
 
-        if level is not None and level.value < self.min_level.value:
-            return
-
         self.manager_instance.write_file(target_filename, formatted)
 
         if level is not None and file_type != eFileType.FILE_LOG:
-            self.manager_instance.write_file(filename_from_enum(eFileType.FILE_LOG), formatted)
+            log_filename = filename_from_enum(eFileType.FILE_LOG)
+            self.manager_instance.write_file(log_filename, formatted)
+            self.manager_instance.flush(target_filename, log_filename)
+        else:
+            self.manager_instance.flush(target_filename)
 
         print(formatted)
         self._log_message = formatted
+        self._last_record = None
 
     @property
     def last_message(self) -> Optional[str]:
         """Returns the last logged message."""
+        if self._log_message is None and self._last_record is not None:
+            self._log_message = format_record(*self._last_record)
         return self._log_message
 
 
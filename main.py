@@ -1,4 +1,7 @@
-from game import Game
+from startup import StartupTracer
+
+with StartupTracer().phase("import"):
+    from game import Game
 
 def run():
     game = Game()
@@ -1,64 +1,152 @@
 import pygame
-from PIL import Image
+import time
 from log import TRACE_LOG
 
-from uicharacterselect import ProgressBoard
+from uicharacterselect import ProgressBoard, progress_board_assets
 
-from typing import Tuple
+from typing import Optional, Tuple, Dict, List
 
 from utils import (
     eMenuState,
     eLogLevel,
     DEBUG_MODE,
+    CONFIG_HOT_RELOAD,
+    BACKGROUND_DELTA_MODE,
+    DIRTY_RECT_RENDERING,
+    FRAME_RATE,
+    IDLE_LOOP_MODE,
+    IDLE_WAIT_TIMEOUT,
     file_name_map,
     eFileType,
-    base_path,
     eFontType,
-    get_font
+    render_text
 
 )
 from config import Config
+from assets_manager import AssetsManager, AssetPreloader, button_states
+from background import BackgroundPlayer, DeltaBackgroundPlayer
+from render import DirtyRectTracker, LayerCache, StaticLayer
+from canvas import VirtualCanvas
+from layout import Layout, LayoutSpec, Node, RectTable, px, ref, screen
+from profiler import Profiler
+from startup import StartupTracer
+from widgets import WidgetRegistry
+
+menu_asset_groups: Dict[str, List[str]] = {
+    "buttons": [
+        f"buttons/{name}_{suffix}.png"
+        for name in ("play", "options", "exit", "back", "resolution01", "drop_down_bar")
+        for suffix in button_states.values()
+    ] + [
+        "buttons/volume_bar_empty.png",
+        "buttons/volume_bar_fill.png",
+        "buttons/on_btn.png",
+        "buttons/off_btn.png",
+    ],
+    "ui": [
+        "ui/logo.png",
+        "ui/transparent_board_03.png",
+    ],
+    "progress_board": progress_board_assets,
+}
+"""Images used by the menu screens, grouped for preloading."""
+
+menu_streamed_groups: Tuple[str, ...] = ("progress_board",)
+"""Asset groups the first screen does not need; they keep decoding while the menu runs."""
+
+menu_logo = Node("midtop", (screen(width=0.5), px(100)), image="ui/logo.png")
+
+menu_layout: Dict[eMenuState, LayoutSpec] = {
+    eMenuState.MENU_STATE_MAIN: {
+        "logo": menu_logo,
+        "play": Node("center", (screen(width=0.5), screen(height=1 / 3, offset=100)), image="buttons/play_default.png"),
+        "options": Node("center", (screen(width=0.5), screen(height=1 / 3, offset=200)), image="buttons/options_default.png"),
+        "exit": Node("center", (screen(width=0.5), screen(height=1 / 3, offset=300)), image="buttons/exit_default.png"),
+    },
+    eMenuState.MENU_STATE_OPTIONS: {
+        "logo": menu_logo,
+        "settings_board": Node("midtop", (screen(width=0.5), screen(width=1 / 6)), size=(screen(height=0.5), screen(height=0.5))),
+        "resolution": Node("center", (screen(width=0.5), screen(height=1 / 3 + 1 / 5)), image="buttons/resolution01_default.png"),
+        "back": Node("center", (screen(width=0.5), screen(height=1 / 3, offset=400)), image="buttons/back_default.png"),
+        "dropdown": Node("topleft", (ref("resolution.left"), ref("resolution.bottom")), size=(ref("back.width", 0.85), ref("back.height"))),
+        "volume": Node("center", (screen(width=0.5), screen(height=0.4)), image="buttons/volume_bar_empty.png"),
+        "fullscreen": Node("topleft", (ref("volume.right", 0.87), ref("volume.bottom")), image="buttons/on_btn.png"),
+        "animated_background": Node("topleft", (ref("volume.right", 0.87), ref("fullscreen.bottom", 1.2)), image="buttons/on_btn.png"),
+        "volume_label": Node("topleft", (ref("volume.left", 1.1), ref("volume.bottom", 0.8))),
+        "fullscreen_label": Node("topleft", (ref("volume.left", 1.1), ref("fullscreen.top", 1.02))),
+        "animated_background_label": Node("topleft", (ref("volume.left", 1.1), ref("animated_background.top", 1.02))),
+    },
+    eMenuState.MENU_STATE_PLAY: {
+        "logo": menu_logo,
+    },
+}
+"""Placement of the menu elements per screen; dropdown is the first resolution option."""
+
+menu_buttons: Dict[eMenuState, Tuple[str, ...]] = {
+    eMenuState.MENU_STATE_MAIN: ("play", "options", "exit"),
+    eMenuState.MENU_STATE_OPTIONS: ("resolution", "back"),
+}
+"""Layout nodes drawn with button_images and hit-tested as buttons."""
+
 
 class Menu:
-    def __init__(self):
+    def __init__(self, config: Optional[Config] = None):
+        """
+        Args:
+            config (Optional[Config]): Settings to use instead of the player's config file, e.g. for benchmarks.
+        """
         self._menu_state = eMenuState.MENU_STATE_MAIN
-        self.config = Config(file_name_map[eFileType.FILE_CONFIG])
-        self.frames = self._load_gif_frames(base_path() + "/assets/bg01.gif")
-        self.current_frame = 0
-        self.frame_delay = 150
-        self.last_frame_time = pygame.time.get_ticks()
+        with StartupTracer().phase("config"):
+            self.config = config if config is not None else Config(file_name_map[eFileType.FILE_CONFIG])
+        self.background = None
 
         self.screen = None
+        self.display = None
+        self.canvas = VirtualCanvas()
+        self.running = True
+        self.window_visible = True
         self.clock = pygame.time.Clock()
+        self.dirty = DirtyRectTracker()
+        self.layers = LayerCache()
+        self.profiler = Profiler()
+
+        self.assets = AssetsManager().scope()
+        self.scaled_assets = AssetsManager().scope()
 
         self.button_images = {}
         self.buttons = {}
+        self.widgets: Dict[eMenuState, WidgetRegistry] = {}
 
-        self.hovered_button = None
-        self.clicked_button = None
+        self.layout: Optional[Layout] = None
+        self.layout_tables: Dict[eMenuState, RectTable] = {}
 
         self.progress_board = None
 
-        self.base_btn_size: Tuple[int, int] = []
-
         self.resolution_dropdown_active: bool = False
         self.available_resolutions = [(1280, 720), (1600, 900), (1920, 1080)]
         self.resolution_options_rects = []
 
         self.animate_background = self.config.animated_background
 
+        self.config.subscribe("animated_background", self._on_animated_background_changed)
+        self.config.subscribe("fullscreen", self._on_display_mode_changed)
+        self.config.subscribe("resolution", self._on_display_mode_changed)
+        self.config.subscribe("volume", self._on_setting_changed)
+
+        if CONFIG_HOT_RELOAD:
+            self.config.watch()
+
     def load_buttons(self):
-        screen_width, screen_height = self.config.resolution
+        """
+        Acquires the menu images and compiles the layout of every available resolution.
 
-        target_width = (screen_width * 0.5)
-        target_height = (screen_height * 0.5)
+        Runs once when the menu opens. The images stay referenced until the menu closes,
+        so resolution changes only go through _apply_layout() and never touch the disk.
+        """
+        self.assets.release()
 
         def load_states(name):
-            return {
-                "default": pygame.image.load(base_path() + f"/assets/buttons/{name}_default.png").convert_alpha(),
-                "hover": pygame.image.load(base_path() + f"/assets/buttons/{name}_over.png").convert_alpha(),
-                "click": pygame.image.load(base_path() + f"/assets/buttons/{name}_click.png").convert_alpha(),
-            }
+            return self.assets.button_states("buttons", name)
 
         self.button_images = {
             "play": load_states("play"),
@@ -68,68 +156,104 @@ class Menu:
             "resolution": load_states("resolution01")
         }
 
-        def center_button(image, y_offset):
-            rect = image.get_rect()
-            rect.center = (screen_width // 2, y_offset + (screen_height // 3))
-            return rect
+        self.logo_image = self.assets.image("ui/logo.png")
+
+        # unscaled sources of the resolution-dependent surfaces
+        self.assets.image("ui/transparent_board_03.png")
+        for suffix in button_states.values():
+            self.assets.image(f"buttons/drop_down_bar_{suffix}.png")
+
+        # volume bar
+        self.volume_bar_empty = self.assets.image("buttons/volume_bar_empty.png")
+        self.volume_bar_fill = self.assets.image("buttons/volume_bar_fill.png")
+
+        # full_screen btn
+        self.fullscreen_on = self.assets.image("buttons/on_btn.png")
+        self.fullscreen_off = self.assets.image("buttons/off_btn.png")
+
+        # animatated bg btn
+        self.animate_bg_btn_on = self.assets.image("buttons/on_btn.png")
+        self.animate_bg_btn_off = self.assets.image("buttons/off_btn.png")
+
+        self.layout = Layout(menu_layout, lambda asset: self.assets.image(asset).get_size())
+        self.layout.precompile([self.ui_size] if self.canvas.enabled else self.available_resolutions)
+
+        self._apply_layout()
+
+    def _apply_layout(self):
+        """
+        Switches to the layout of the current resolution.
+
+        Swaps in the precompiled rect table and rescales the resolution-dependent surfaces
+        from their cached sources.
+        """
+        self.layout_tables = self.layout.tables(self.ui_size)
+        options = self.layout_tables[eMenuState.MENU_STATE_OPTIONS]
+
+        self.dirty.invalidate()
+        self.layers.invalidate()
 
         self.buttons = {
-            eMenuState.MENU_STATE_MAIN: {
-                "play": center_button(self.button_images["play"]["default"], 100),
-                "options": center_button(self.button_images["options"]["default"], 200),
-                "exit": center_button(self.button_images["exit"]["default"], 300),
-            },
-            eMenuState.MENU_STATE_OPTIONS: {
-                "resolution": center_button(self.button_images["resolution"]["default"], screen_height // 5),
-
-                "back": center_button(self.button_images["back"]["default"], 400)
-            }
+            state: {label: self.layout_tables[state][label] for label in labels}
+            for state, labels in menu_buttons.items()
         }
 
+        self.logo_rect = self.layout_tables[eMenuState.MENU_STATE_MAIN]["logo"]
+        self.settings_board_rect = options["settings_board"]
+        self.volume_bar_rect = options["volume"]
+        self.fullscreen_btn_rect = options["fullscreen"]
+        self.animate_bg_btn_rect = options["animated_background"]
+
+        self.scaled_assets.release()
+        self.settings_board = self.scaled_assets.image("ui/transparent_board_03.png", self.settings_board_rect.size)
         self.dropdown_images = {
-            "default": pygame.image.load(base_path() + "/assets/buttons/drop_down_bar_default.png").convert_alpha(),
-            "hover": pygame.image.load(base_path() + "/assets/buttons/drop_down_bar_over.png").convert_alpha(),
-            "click": pygame.image.load(base_path() + "/assets/buttons/drop_down_bar_click.png").convert_alpha(),
+            state: self.scaled_assets.image(f"buttons/drop_down_bar_{suffix}.png", options["dropdown"].size)
+            for state, suffix in button_states.items()
         }
 
+        # The board is built when the play screen is entered; rebuild it only if it is showing.
+        self._reset_progress_board(create=self.menu_state == eMenuState.MENU_STATE_PLAY)
+        self._register_widgets()
 
-        self.logo_image = pygame.image.load(base_path() + "/assets/ui/logo.png").convert_alpha()
-        self.logo_rect = self.logo_image.get_rect(midtop=(screen_width // 2, 100))
-
-        # settings board
-        self.settings_board = pygame.image.load(base_path() + "/assets/ui/transparent_board_03.png").convert_alpha()
-        self.settings_board = pygame.transform.scale(self.settings_board, (target_height, target_height))
-        self.settings_board_rect = self.settings_board.get_rect(midtop=(screen_width // 2, screen_width // 6))
+    def _register_widgets(self):
+        """
+        Rebuilds the hit-test index of every menu screen from the current layout.
+        """
+        self.widgets = {state: WidgetRegistry() for state in eMenuState}
 
-        # volume bar
-        self.volume_bar_empty = pygame.image.load(base_path() + "/assets/buttons/volume_bar_empty.png").convert_alpha()
-        self.volume_bar_fill = pygame.image.load(base_path() + "/assets/buttons/volume_bar_fill.png").convert_alpha()
-        self.volume_bar_rect = self.volume_bar_empty.get_rect(center=(screen_width // 2, screen_height // 2.5))
+        for state, buttons in self.buttons.items():
+            for label, rect in buttons.items():
+                self.widgets[state].register(label, rect)
 
-        # full_screen btn
-        self.fullscreen_on = pygame.image.load(base_path()+ "/assets/buttons/on_btn.png").convert_alpha()
-        self.fullscreen_off = pygame.image.load(base_path()+ "/assets/buttons/off_btn.png").convert_alpha()
-        self.fullscreen_btn_rect = self.fullscreen_on.get_rect(topleft=(self.volume_bar_rect.right * 0.87, self.volume_bar_rect.bottom))
+        options = self.widgets[eMenuState.MENU_STATE_OPTIONS]
+        options.register("volume", self.volume_bar_rect, hoverable=False)
+        options.register("fullscreen", self.fullscreen_btn_rect, hoverable=False)
+        options.register("animated_background", self.animate_bg_btn_rect, hoverable=False)
 
-        # animatated bg btn
-        self.animate_bg_btn_on = pygame.image.load(base_path()+ "/assets/buttons/on_btn.png").convert_alpha()
-        self.animate_bg_btn_off = pygame.image.load(base_path()+ "/assets/buttons/off_btn.png").convert_alpha()
-        self.animate_bg_btn_rect = self.animate_bg_btn_on.get_rect(topleft=(self.volume_bar_rect.right * 0.87, self.fullscreen_btn_rect.bottom * 1.2))
+        if self.resolution_dropdown_active:
+            self.generate_resolution_rects()
 
-        self.progress_board = ProgressBoard(self.screen.get_width(), self.screen.get_height())
+        self._track_hover(self.canvas.mouse_pos())
 
-        self.base_btn_size = self.button_images["back"]["default"].get_size()
+    @property
+    def ui_size(self) -> Tuple[int, int]:
+        """
+        Size the UI is laid out and drawn at: the virtual canvas, or the window resolution.
+        """
+        return self.canvas.size if self.canvas.enabled else self.config.resolution
 
-        # resize resolution btn
-        for state in ("default", "hover", "click"):
-            drop_down_pre = self.button_images["resolution"][state]
-            drop_down_box = self.dropdown_images[state]
+    @property
+    def active_widgets(self) -> WidgetRegistry:
+        return self.widgets.setdefault(self.menu_state, WidgetRegistry())
 
-#            self.button_images["resolution"][state] = pygame.transform.scale(drop_down_pre, (self.base_btn_size[0] * 1.0, self.base_btn_size[1] * 1.0))
-            self.dropdown_images[state] = pygame.transform.scale(drop_down_box, (self.base_btn_size[0] * 0.85, self.base_btn_size[1] * 1.0))
+    def _reset_progress_board(self, create: bool = True):
+        # The new board is created first so that the images the old one releases are still
+        # referenced and are not evicted and decoded again.
+        previous = self.progress_board
+        self.progress_board = ProgressBoard(self.screen.get_width(), self.screen.get_height()) if create else None
 
-        self.buttons[eMenuState.MENU_STATE_OPTIONS]["resolution"] = self.button_images["resolution"]["default"].get_rect(
-            center=self.buttons[eMenuState.MENU_STATE_OPTIONS]["resolution"].center)
+        if previous:
+            previous.unload()
 
     @property
     def menu_state(self) -> eMenuState:
@@ -144,97 +268,323 @@ class Menu:
         else:
             raise ValueError(f"Invalid menu state: {new_state}")
 
+        self.config.flush()
+        self._set_dropdown_active(False)
+        self.dirty.invalidate()
+
         #fixme002 -> create new input board after its closed, the initial instance is destroyed in build_menu
         if self._menu_state == eMenuState.MENU_STATE_PLAY:
-            self.progress_board = ProgressBoard(self.screen.get_width(), self.screen.get_height())
+            self._reset_progress_board()
 
-    def build_menu(self):
-        pygame.init()
+        if self.screen:
+            self.active_widgets.reset()
+            self._track_hover(self.canvas.mouse_pos())
 
-        if not self.screen:
-            self.screen = pygame.display.set_mode((self.config.resolution[0], self.config.resolution[1]))
-            pygame.display.set_caption("Game Menu")
+    def open(self):
+        """
+        Opens the window and loads everything the menu needs before its first frame.
+        """
+        tracer = StartupTracer()
 
-        self.load_buttons()
+        with tracer.phase("display"):
+            pygame.init()
 
-        running = True
-        while running:
-            for event in pygame.event.get():
+            if not self.screen:
+                self.display = pygame.display.set_mode((self.config.resolution[0], self.config.resolution[1]))
+                self.screen = self.canvas.attach(self.display)
+                pygame.display.set_caption("Game Menu")
 
-                if self.menu_state == eMenuState.MENU_STATE_PLAY:
-                    result = self.progress_board.handle_event(event)
-                    if result == "back":
-                        self.progress_board = None
-                        self.menu_state = eMenuState.MENU_STATE_MAIN
+        with tracer.phase("assets"):
+            self._preload_assets()
 
-                if event.type == pygame.QUIT:
-                    running = False
-                    pygame.quit()
-                    exit()
+        with tracer.phase("layout"):
+            self.load_buttons()
 
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if self.menu_state == eMenuState.MENU_STATE_OPTIONS:
-                        resolution_btn = self.buttons[eMenuState.MENU_STATE_OPTIONS]["resolution"]
-
-                        if self.resolution_dropdown_active and resolution_btn.collidepoint(event.pos):
-                            self.resolution_dropdown_active = False
-
-                        elif not self.resolution_dropdown_active and resolution_btn.collidepoint(event.pos):
-                            self.resolution_dropdown_active = True
-                            self.generate_resolution_rects()
-
-                        elif self.resolution_dropdown_active:
-                            for res, rect in self.resolution_options_rects:
-                                if rect.collidepoint(event.pos):
-                                    self._set_resolution(res)
-                                    self.resolution_dropdown_active = False
-                                    break
-
-                        if self.volume_bar_rect.collidepoint(event.pos):
-                            self._update_volume(event.pos[0])
-                        elif self.fullscreen_btn_rect.collidepoint(event.pos):
-                            self._toggle_fullscreen()
-                        elif self.animate_bg_btn_rect.collidepoint(event.pos):
-                            self._toggle_animated_background()
-
-                    for label, rect in self.buttons.get(self.menu_state, {}).items():
-                        if rect.collidepoint(event.pos):
-                            self.clicked_button = label
-
-                elif event.type == pygame.MOUSEBUTTONUP:
-                    if self.clicked_button:
-                        label = self.clicked_button
-                        self.clicked_button = None
-                        rect = self.buttons.get(self.menu_state, {}).get(label)
-                        if rect and rect.collidepoint(pygame.mouse.get_pos()):
-                            self._handle_click(label)
-
-            if self.animate_background:
-                now = pygame.time.get_ticks()
-                if now - self.last_frame_time > self.frame_delay:
-                    self.current_frame = (self.current_frame + 1) % len(self.frames)
-                    self.last_frame_time = now
+    def first_frame(self):
+        """
+        Draws the first frame and ends the startup trace.
+        """
+        with StartupTracer().phase("first_frame"):
+            self.update(0.0)
+            self.render()
+        StartupTracer().finish()
+
+    def build_menu(self):
+        """
+        Runs the menu on its own variable-step loop until it is closed.
+        """
+        self.open()
+        self.first_frame()
+
+        while self.running:
+            events = self.wait_events() if IDLE_LOOP_MODE else None
+            frame_start = time.perf_counter()
+            with self.profiler.phase("events"):
+                for event in (pygame.event.get() if events is None else events):
+                    self.handle_event(self.canvas.translate(event))
+
+            with self.profiler.phase("update"):
+                self.update(1.0 / FRAME_RATE)
 
-            self.screen.blit(self.frames[self.current_frame], (0, 0))
-            self._draw_buttons()
+            self.render()
 
-            pygame.display.flip()
-            self.clock.tick(60)
+            self.config.update()
+            AssetsManager().poll_preloaders(frame_start + 1.0 / FRAME_RATE)
+            self.clock.tick(FRAME_RATE)
 
-#            if self.menu_state == eMenuState.MENU_STATE_PLAY:
-#                running = False
+        pygame.quit()
+        exit()
+
+    def handle_event(self, event: pygame.event.Event):
+        if self.menu_state == eMenuState.MENU_STATE_PLAY:
+            self.dirty.invalidate()
+            result = self.progress_board.handle_event(event)
+            if result == "back":
+                self._reset_progress_board(create=False)
+                self.menu_state = eMenuState.MENU_STATE_MAIN
+
+        if event.type == pygame.QUIT:
+            self.running = False
+
+        elif event.type == pygame.MOUSEMOTION:
+            self._track_hover(event.pos)
+
+        elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE, pygame.WINDOWSHOWN, pygame.WINDOWRESTORED):
+            self.window_visible = True
+            self.dirty.invalidate()
+
+        elif event.type in (pygame.WINDOWHIDDEN, pygame.WINDOWMINIMIZED):
+            self.window_visible = False
+
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.profiler.toggle_overlay()
+
+        elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+            self.profiler.export_trace()
+
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            widgets = self.active_widgets
+            key = widgets.press(event.pos)
+            if key is not None:
+                self.dirty.invalidate(widgets.rect(key))
+
+            if self.menu_state == eMenuState.MENU_STATE_OPTIONS:
+                self._handle_options_press(key, event.pos)
+
+        elif event.type == pygame.MOUSEBUTTONUP:
+            widgets = self.active_widgets
+            pressed = widgets.pressed
+            key = widgets.release(event.pos)
+            if pressed is not None:
+                self.dirty.invalidate(widgets.rect(pressed))
+            if key in self.buttons.get(self.menu_state, {}):
+                self._handle_click(key)
+
+    def update(self, dt: float):
+        """
+        Advances the menu by one step.
+
+        Args:
+            dt (float): Length of the step in seconds.
+        """
+        if IDLE_LOOP_MODE and not self.window_visible:
+            return
+
+        overlay_rect = self.profiler.update_overlay()
+        if overlay_rect is not None:
+            self.dirty.invalidate(overlay_rect)
+
+        if self.background.update(pygame.time.get_ticks(), self.animate_background):
+            if isinstance(self.background, DeltaBackgroundPlayer):
+                for rect in self.background.dirty_rects:
+                    self.dirty.invalidate(rect)
+            else:
+                self.dirty.invalidate()
+
+    def render(self, alpha: float = 1.0):
+        """
+        Draws the current frame.
+
+        Args:
+            alpha (float): Fraction of a fixed update step elapsed since the last update, for
+                interpolating moving elements. The menu screens are static, so it is unused here.
+        """
+        if IDLE_LOOP_MODE and not self.window_visible:
+            return
+
+        if DIRTY_RECT_RENDERING:
+            self._render_dirty()
+        elif not IDLE_LOOP_MODE or self.dirty.dirty:
+            self._draw_frame()
+            self._present()
+            self.dirty.clear()
+
+    def _draw_frame(self, rects: Optional[List[pygame.Rect]] = None):
+        """
+        Draws the whole frame, or only the given regions of it, as one "draw" profiler sample.
+        """
+        with self.profiler.phase("draw"):
+            for rect in (None,) if rects is None else rects:
+                self.screen.set_clip(rect)
+                self.background.draw(self.screen)
+                self._draw_buttons()
+                self.profiler.draw_overlay(self.screen)
+            self.screen.set_clip(None)
+
+    def _present(self, rects: Optional[List[pygame.Rect]] = None):
+        """
+        Puts the drawn frame on the window: scales the virtual canvas if one is used, then
+        updates the given regions or flips the whole display.
+        """
+        with self.profiler.phase("present"):
+            self.canvas.present()
+
+        with self.profiler.phase("flip"):
+            if rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update([self.canvas.to_display(rect) for rect in rects])
+
+    def idle_timeout(self) -> int:
+        """
+        Returns how many milliseconds the loop may block waiting for input before it has
+        to render, advance the background or service the config.
+        """
+        if self.window_visible and self.dirty.dirty:
+            return 0
+
+        timeout = IDLE_WAIT_TIMEOUT
+
+        if self.window_visible:
+            background = self.background
+            if background.surface is None and not background.failed:
+                timeout = 1000 // FRAME_RATE
+            elif self.animate_background and not background.is_static:
+                now = pygame.time.get_ticks()
+                # A passed deadline means the next frame is still being decoded.
+                timeout = background.next_frame_time - now if background.next_frame_time > now else 1000 // FRAME_RATE
+
+        config_deadline = self.config.next_update()
+        if config_deadline is not None:
+            timeout = min(timeout, int((config_deadline - time.monotonic()) * 1000) + 1)
+
+        return max(0, min(timeout, IDLE_WAIT_TIMEOUT))
+
+    def wait_events(self) -> List[pygame.event.Event]:
+        """
+        Blocks until input arrives or the next scheduled update is due, instead of polling
+        every frame while nothing on screen changes.
+        """
+        timeout = self.idle_timeout()
+        if timeout <= 0:
+            return pygame.event.get()
+
+        event = pygame.event.wait(timeout)
+        events = [] if event.type == pygame.NOEVENT else [event]
+        events.extend(pygame.event.get())
+        return events
+
+    def _render_dirty(self):
+        """
+        Redraws only the regions invalidated since the last frame and pushes just those to the display.
+        """
+        if not self.dirty.dirty:
+            return
+
+        if self.dirty.full:
+            self._draw_frame()
+            self._present()
+            self.dirty.clear()
+            return
+
+        rects = self.dirty.rects(self.screen.get_rect())
+        self._draw_frame(rects)
+        self._present(rects)
+        self.dirty.clear()
+
+    def _track_hover(self, pos):
+        """
+        Invalidates buttons and dropdown options whose hover state changes with the mouse position.
+        """
+        widgets = self.active_widgets
+        previous = widgets.hovered
+
+        for rect in widgets.hover(pos):
+            self.dirty.invalidate(rect)
+
+        if widgets.hovered == previous:
+            return
+
+        # Dropdown options are drawn offset from their hit rects, so their image area is
+        # invalidated as well.
+        for key in (previous, widgets.hovered):
+            rect = widgets.rect(key) if key in self.available_resolutions else None
+            if rect is not None:
+                self.dirty.invalidate(rect.union(self._dropdown_image_rect(rect)))
+
+    def _dropdown_image_rect(self, rect: pygame.Rect) -> pygame.Rect:
+        """
+        Returns the area the image of a dropdown option is drawn to, 15 px right of its hit rect.
+        """
+        return self.dropdown_images["default"].get_rect(topleft=(rect.left + 15, rect.top))
+
+    def _handle_options_press(self, key, pos):
+        """
+        Routes a mouse press on the options screen to the widget under the mouse.
+        """
+        self.dirty.invalidate()
+
+        if key == "resolution":
+            self._set_dropdown_active(not self.resolution_dropdown_active)
+        elif key in self.available_resolutions:
+            self._set_dropdown_active(False)
+            self._set_resolution(key)
+        elif key == "volume":
+            self._update_volume(pos[0])
+        elif key == "fullscreen":
+            self._toggle_fullscreen()
+        elif key == "animated_background":
+            self._toggle_animated_background()
+
+        self._track_hover(pos)
 
     def _draw_buttons(self):
-        mouse_pos = pygame.mouse.get_pos()
+        widgets = self.active_widgets
 
-        self.screen.blit(self.logo_image, self.logo_rect.topleft)
+        self.layers.get(self.menu_state, self.screen.get_size(), self._build_static_layer).draw(self.screen)
 
         if self.menu_state == eMenuState.MENU_STATE_PLAY:
-            self.progress_board.draw(self.screen)
+            with self.profiler.phase("progress_board"):
+                self.progress_board.draw(self.screen)
 
-        elif self.menu_state == eMenuState.MENU_STATE_OPTIONS:
-            self.screen.blit(self.settings_board, self.settings_board_rect.topleft)
-            self.screen.blit(self.volume_bar_empty, self.volume_bar_rect.topleft)
+        for label, rect in self.buttons.get(self.menu_state, {}).items():
+            image = self.button_images[label][widgets.state(label)]
+            self.screen.blit(image, rect.topleft)
+
+        if self.resolution_dropdown_active:
+            for res, rect in self.resolution_options_rects:
+                if widgets.hovered == res:
+                    img = self.dropdown_images["hover"]
+                else:
+                    img = self.dropdown_images["default"]
+                self.screen.blit(img, self._dropdown_image_rect(rect))
+
+                label = render_text(eFontType.FONT_TYPE_UPHEAVAL, 24, f"{res[0]}x{res[1]}", (0, 0, 0))
+                label_rect = label.get_rect(center=rect.center)
+                self.screen.blit(label, label_rect)
+
+
+    def _build_static_layer(self, layer: StaticLayer):
+        """
+        Composites the parts of the current screen that only change with the config or the resolution.
+        """
+        layer.blit(self.logo_image, self.logo_rect.topleft)
+
+        if self.menu_state == eMenuState.MENU_STATE_OPTIONS:
+            options = self.layout_tables[eMenuState.MENU_STATE_OPTIONS]
+
+            layer.blit(self.settings_board, self.settings_board_rect.topleft)
+            layer.blit(self.volume_bar_empty, self.volume_bar_rect.topleft)
 
             # volume bar
             volume = self.config.volume 
@@ -242,65 +592,35 @@ class Menu:
             fill_width = int((volume / 100) * max_width)
 
             fill_surface = self.volume_bar_fill.subsurface((0, 0, fill_width, self.volume_bar_fill.get_height()))
-            self.screen.blit(fill_surface, self.volume_bar_rect.topleft)
+            layer.blit(fill_surface, self.volume_bar_rect.topleft)
             # volume bar end
 
             # volume bar tooltip
-            font = get_font(eFontType.FONT_TYPE_UPHEAVAL, 28)
-            volume_bar_text = font.render("Volume settings", True, (232, 232, 232))
-            self.screen.blit(volume_bar_text, (self.volume_bar_rect.bottomleft[0] * 1.1, self.volume_bar_rect.bottomleft[1] * 0.8))
+            volume_bar_text = render_text(eFontType.FONT_TYPE_UPHEAVAL, 28, "Volume settings", (232, 232, 232))
+            layer.blit(volume_bar_text, options["volume_label"].topleft)
             # volume bar tooltip end
 
             # full screen toggle btn
             fullscreen_on = self.config.fullscreen
             btn_image = self.fullscreen_on if fullscreen_on else self.fullscreen_off
-            self.screen.blit(btn_image, self.fullscreen_btn_rect.topleft)    
+            layer.blit(btn_image, self.fullscreen_btn_rect.topleft)    
             # full screen toggle btn end
 
             # full screen toggle tooltip
-            full_screen_toggle_text = font.render("Fullscreen mode", True, (232, 232, 232))
-            self.screen.blit(full_screen_toggle_text, (self.volume_bar_rect.bottomleft[0] * 1.1, self.fullscreen_btn_rect.topleft[1] * 1.02))
+            full_screen_toggle_text = render_text(eFontType.FONT_TYPE_UPHEAVAL, 28, "Fullscreen mode", (232, 232, 232))
+            layer.blit(full_screen_toggle_text, options["fullscreen_label"].topleft)
             # full screen toggle tooltip end
 
             # animate btn toggle btn
             animated_bg_on = self.config.animated_background
             btn_animated = self.animate_bg_btn_on if animated_bg_on else self.animate_bg_btn_off
-            self.screen.blit(btn_animated, self.animate_bg_btn_rect.topleft)
+            layer.blit(btn_animated, self.animate_bg_btn_rect.topleft)
 
             # full screen toggle tooltip
-            animated_bg_text = font.render("Animated bg", True, (232, 232, 232))
-            self.screen.blit(animated_bg_text, (self.volume_bar_rect.bottomleft[0] * 1.1, self.animate_bg_btn_rect.topleft[1] * 1.02))
+            animated_bg_text = render_text(eFontType.FONT_TYPE_UPHEAVAL, 28, "Animated bg", (232, 232, 232))
+            layer.blit(animated_bg_text, options["animated_background_label"].topleft)
             # full screen toggle tooltip end
 
-            # resolution drop down btn
-            # resolution drop down btn end
-
-        for label, rect in self.buttons.get(self.menu_state, {}).items():
-            if rect.collidepoint(mouse_pos):
-                if self.clicked_button == label:
-                    state = "click"
-                else:
-                    state = "hover"
-                self.hovered_button = label
-            else:
-                state = "default"
-
-            image = self.button_images[label][state]
-            self.screen.blit(image, rect.topleft)
-
-        if self.resolution_dropdown_active:
-            for res, rect in self.resolution_options_rects:
-                if rect.collidepoint(mouse_pos):
-                    img = self.dropdown_images["hover"]
-                else:
-                    img = self.dropdown_images["default"]
-                self.screen.blit(img, (rect.topleft[0] + 15, rect.topleft[1]))
-
-                label = get_font(eFontType.FONT_TYPE_UPHEAVAL, 24).render(f"{res[0]}x{res[1]}", True, (0, 0, 0))
-                label_rect = label.get_rect(center=rect.center)
-                self.screen.blit(label, label_rect)
-
-
     def _handle_click(self, label: str):
         if self.menu_state == eMenuState.MENU_STATE_MAIN:
             if label == "play":
@@ -308,8 +628,7 @@ class Menu:
             elif label == "options":
                 self.menu_state = eMenuState.MENU_STATE_OPTIONS
             elif label == "exit":
-                pygame.quit()
-                exit()
+                self.running = False
         elif self.menu_state == eMenuState.MENU_STATE_OPTIONS:
             if label == "back":
                 self.menu_state = eMenuState.MENU_STATE_MAIN
@@ -317,21 +636,46 @@ class Menu:
                 # handling resolution done above
                 pass
 
-    def _load_gif_frames(self, path: str) -> list[pygame.Surface]:
-        frames = []
-        try:
-            gif = Image.open(path)
-            while True:
-                frame = gif.convert("RGBA")
-                mode = frame.mode
-                size = frame.size
-                data = frame.tobytes()
-                surface = pygame.image.fromstring(data, size, mode)
-                frames.append(surface)
-                gif.seek(gif.tell() + 1)
-        except EOFError:
-            pass
-        return frames
+    def _preload_assets(self):
+        """
+        Decodes the images of the first screen on worker threads and starts streaming the
+        background while showing a loading bar.
+
+        The groups in menu_streamed_groups are only started here. Their decoded images are
+        finalized by AssetsManager().poll_preloaders() from the frame loop, and anything
+        that is used before then is loaded on demand.
+        """
+        manager = AssetsManager()
+        preloader = manager.preload({group: assets for group, assets in menu_asset_groups.items() if group not in menu_streamed_groups})
+
+        if not self.background:
+            player = DeltaBackgroundPlayer if BACKGROUND_DELTA_MODE else BackgroundPlayer
+            self.background = player("bg01.gif", self.ui_size)
+
+        # A background that failed to decode finishes without becoming ready; it is drawn black.
+        while not preloader.done or not (self.background.ready or self.background.finished):
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    exit()
+
+            self._draw_loading_screen(preloader)
+            self.clock.tick(FRAME_RATE)
+
+        manager.preload({group: menu_asset_groups[group] for group in menu_streamed_groups})
+
+    def _draw_loading_screen(self, preloader: AssetPreloader):
+        progress = preloader.poll()
+
+        width, height = self.screen.get_size()
+        bar = pygame.Rect(0, 0, width // 2, 24)
+        bar.center = (width // 2, height // 2)
+
+        self.screen.fill((0, 0, 0))
+        pygame.draw.rect(self.screen, (232, 232, 232), bar, 2)
+        pygame.draw.rect(self.screen, (232, 232, 232), (bar.x, bar.y, int(bar.width * progress), bar.height))
+        self.canvas.present()
+        pygame.display.flip()
 
     def _update_volume(self, mouse_x: int):
         bar_x = self.volume_bar_rect.x
@@ -346,7 +690,14 @@ class Menu:
         self.config.save()
         print(f"[Menu] Animated bg set to: {self.config.animated_background}")
 
-        self.animate_background = True if self.config.animated_background else False
+    def _on_animated_background_changed(self, key: str, enabled: bool):
+        self.animate_background = enabled
+        self.layers.invalidate()
+        self.dirty.invalidate()
+
+    def _on_setting_changed(self, key: str, value):
+        self.layers.invalidate()
+        self.dirty.invalidate()
 
     def _toggle_fullscreen(self):
         self.config.fullscreen = not self.config.fullscreen
@@ -354,25 +705,47 @@ class Menu:
         if DEBUG_MODE:
             TRACE_LOG(eLogLevel.LOG_LEVEL_LOG, f"[Menu] Fullscreen set to: {self.config.fullscreen}")
 
+    def _on_display_mode_changed(self, key: str, value):
+        if not self.screen:
+            return
+
         flags = pygame.FULLSCREEN if self.config.fullscreen else 0
-        self.screen = pygame.display.set_mode(self.config.resolution, flags)
+        self.display = pygame.display.set_mode(self.config.resolution, flags)
+        self.screen = self.canvas.attach(self.display)
+        self.dirty.invalidate()
+
+        # The canvas keeps its size, so its layout, layers and scaled surfaces stay valid.
+        if self.canvas.enabled:
+            return
+
+        self.layers.invalidate()
+
+        if key == "resolution":
+            self.background.resize(self.config.resolution)
+            self._apply_layout()
+
+    def _set_dropdown_active(self, active: bool):
+        self.resolution_dropdown_active = active
+        if active:
+            self.generate_resolution_rects()
+            return
+
+        widgets = self.widgets.get(eMenuState.MENU_STATE_OPTIONS)
+        for res, _ in self.resolution_options_rects:
+            if widgets:
+                widgets.unregister(res)
+        self.resolution_options_rects.clear()
 
     def generate_resolution_rects(self):
-        base_rect = self.buttons[eMenuState.MENU_STATE_OPTIONS]["resolution"]
-        img_width, img_height = self.dropdown_images["default"].get_size()
+        first_rect = self.layout_tables[eMenuState.MENU_STATE_OPTIONS]["dropdown"]
+        widgets = self.widgets[eMenuState.MENU_STATE_OPTIONS]
 
+        self.resolution_options_rects.clear()
         for i, res in enumerate(self.available_resolutions):
-            rect = pygame.Rect(
-                base_rect.left,
-                base_rect.bottom + i * img_height,
-                img_width,
-                img_height
-            )
+            rect = first_rect.move(0, i * first_rect.height)
             self.resolution_options_rects.append((res, rect))
+            widgets.register(res, rect)
 
     def _set_resolution(self, resolution):
         self.config.resolution = resolution
         self.config.save()
-        flags = pygame.FULLSCREEN if self.config.fullscreen else 0
-        self.screen = pygame.display.set_mode(resolution, flags)
-        self.load_buttons()
@@ -0,0 +1,211 @@
+import json
+import os
+import time
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Tuple
+
+import pygame
+
+from file_manager import FileManager
+from log import TRACE_LOG
+from text import glyph_atlas
+from utils import (
+    singleton,
+    eDirType,
+    eFontType,
+    eLogLevel,
+    PROFILER_ENABLED,
+    PROFILER_CAPACITY,
+    PROFILER_OVERLAY_INTERVAL
+)
+
+Sample = Tuple[str, float, float]
+"""(phase, start, duration) with times in time.perf_counter() seconds."""
+
+PERCENTILES: Tuple[float, ...] = (0.50, 0.95, 0.99)
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+class _NullPhase:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+
+class _Phase:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.profiler.samples.append((self.name, self.start, time.perf_counter() - self.start))
+
+
+_null_phase = _NullPhase()
+
+
+@singleton
+class Profiler:
+    """
+    Records how long each phase of a frame takes.
+
+    Phases are timed with `with Profiler().phase("name"):` blocks and stored in a ring buffer
+    of the last `capacity` samples, so memory stays constant however long the game runs.
+    The overlay shows p50/p95/p99 per phase and export_trace() writes the buffer as Chrome
+    trace JSON (chrome://tracing, Perfetto) to the log directory.
+    """
+
+    def __init__(self, capacity: int = PROFILER_CAPACITY, enabled: bool = bool(PROFILER_ENABLED)):
+        self.enabled = enabled
+        self.samples: Deque[Sample] = deque(maxlen=capacity)
+
+        self.overlay_visible = False
+        self.overlay_rect = pygame.Rect(0, 0, 0, 0)
+        self._overlay_lines: List[str] = []
+        self._next_overlay_update = 0.0
+
+    def phase(self, name: str):
+        """
+        Returns a context manager timing the enclosed block as one sample of the phase.
+        """
+        if not self.enabled:
+            return _null_phase
+        return _Phase(self, name)
+
+    def stats(self) -> Dict[str, Tuple[float, ...]]:
+        """
+        Returns the percentiles of every phase in the buffer.
+
+        Returns:
+            Dict[str, Tuple[float, ...]]: p50, p95 and p99 in milliseconds per phase.
+        """
+        durations: Dict[str, List[float]] = {}
+        for name, _, duration in self.samples:
+            durations.setdefault(name, []).append(duration * 1000.0)
+
+        result = {}
+        for name, values in durations.items():
+            values.sort()
+            result[name] = tuple(percentile(values, fraction) for fraction in PERCENTILES)
+        return result
+
+    def toggle_overlay(self) -> None:
+        """
+        Shows or hides the overlay. Showing it starts recording if the profiler is disabled.
+        """
+        self.overlay_visible = not self.overlay_visible
+        self.enabled = self.enabled or self.overlay_visible
+        self._next_overlay_update = 0.0
+
+    def update_overlay(self) -> Optional[pygame.Rect]:
+        """
+        Recomputes the overlay text once every PROFILER_OVERLAY_INTERVAL seconds.
+
+        Returns:
+            Optional[pygame.Rect]: Screen area to redraw, or None if the overlay did not change.
+        """
+        if not self.overlay_visible:
+            if self.overlay_rect.width:
+                rect, self.overlay_rect = self.overlay_rect, pygame.Rect(0, 0, 0, 0)
+                return rect
+            return None
+
+        now = time.perf_counter()
+        if now < self._next_overlay_update:
+            return None
+        self._next_overlay_update = now + PROFILER_OVERLAY_INTERVAL
+
+        self._overlay_lines = ["phase            p50    p95    p99 ms"] + [
+            f"{name:<14}" + "".join(f"{value:7.2f}" for value in values)
+            for name, values in sorted(self.stats().items())
+        ]
+
+        atlas = glyph_atlas(eFontType.FONT_TYPE_UPHEAVAL, 14, (232, 232, 232))
+        width = max(atlas.size(line)[0] for line in self._overlay_lines)
+
+        previous = self.overlay_rect
+        self.overlay_rect = pygame.Rect(8, 8, width + 16, len(self._overlay_lines) * atlas.height + 16)
+        return previous.union(self.overlay_rect) if previous.width else self.overlay_rect
+
+    def draw_overlay(self, screen: pygame.Surface) -> None:
+        if not self.overlay_visible or not self._overlay_lines:
+            return
+
+        screen.fill((0, 0, 0), self.overlay_rect)
+
+        atlas = glyph_atlas(eFontType.FONT_TYPE_UPHEAVAL, 14, (232, 232, 232))
+        x, y = self.overlay_rect.x + 8, self.overlay_rect.y + 8
+        for line in self._overlay_lines:
+            atlas.draw(screen, line, (x, y))
+            y += atlas.height
+
+    def export_trace(self, file_name: Optional[str] = None) -> Optional[str]:
+        """
+        Writes the buffered samples as Chrome trace JSON into the log directory.
+
+        Args:
+            file_name (Optional[str]): Name of the trace file; defaults to a timestamped name.
+
+        Returns:
+            Optional[str]: Full path of the written file, or None if writing failed.
+        """
+        file_name = file_name or f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+
+        trace = {
+            "traceEvents": [
+                {
+                    "name": name,
+                    "ph": "X",
+                    "ts": round(start * 1e6, 3),
+                    "dur": round(duration * 1e6, 3),
+                    "pid": os.getpid(),
+                    "tid": 1,
+                }
+                for name, start, duration in self.samples
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+        manager_instance = FileManager()
+        manager_instance.set_working_path(eDirType.DIR_TYPE_LOG)
+        full_path = os.path.join(manager_instance.working_dir, file_name)
+
+        try:
+            with open(full_path, "w", encoding="utf-8") as fp:
+                json.dump(trace, fp)
+        except OSError as err:
+            TRACE_LOG(eLogLevel.LOG_LEVEL_ERROR, f"[Profiler] Could not export trace: {err}")
+            return None
+
+        TRACE_LOG(eLogLevel.LOG_LEVEL_LOG, f"[Profiler] Exported {len(self.samples)} samples to {full_path}")
+        return full_path
+
+
+if __name__ == "__main__":
+    """
+    Debugging and manual testing block.
+    """
+    profiler = Profiler()
+
+    for _ in range(1000):
+        with profiler.phase("frame"):
+            with profiler.phase("work"):
+                sum(range(1000))
+
+    print(profiler.stats())
+    print(profiler.export_trace("trace_debug.json"))
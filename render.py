@@ -0,0 +1,132 @@
+import pygame
+from typing import List, Optional, Union, Tuple, Dict, Any, Callable
+
+RectLike = Union[pygame.Rect, Tuple[int, int, int, int]]
+
+
+def merge_rects(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+    """
+    Merges overlapping or touching rectangles, so every screen region is redrawn only once.
+
+    Args:
+        rects (List[pygame.Rect]): Rectangles to merge.
+
+    Returns:
+        List[pygame.Rect]: Non-overlapping rectangles covering the input.
+    """
+    merged: List[pygame.Rect] = []
+
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        i = 0
+        while i < len(merged):
+            if rect.inflate(2, 2).colliderect(merged[i]):
+                rect.union_ip(merged.pop(i))
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+
+    return merged
+
+
+class DirtyRectTracker:
+    """
+    Collects the screen regions that have to be redrawn in the next frame.
+
+    Widgets call invalidate() with their rect when their visual state changes, or without
+    a rect when the whole screen has to be redrawn.
+    """
+
+    def __init__(self):
+        self.full: bool = True
+        self._rects: List[pygame.Rect] = []
+
+    def invalidate(self, rect: Optional[RectLike] = None) -> None:
+        if rect is None:
+            self.full = True
+        elif not self.full:
+            self._rects.append(pygame.Rect(rect))
+
+    @property
+    def dirty(self) -> bool:
+        return self.full or bool(self._rects)
+
+    def rects(self, bounds: pygame.Rect) -> List[pygame.Rect]:
+        """
+        Returns the merged dirty rectangles clipped to bounds.
+        """
+        if self.full:
+            return [pygame.Rect(bounds)]
+        return [rect for rect in (r.clip(bounds) for r in merge_rects(self._rects)) if rect.width and rect.height]
+
+    def clear(self) -> None:
+        self.full = False
+        self._rects.clear()
+
+
+class StaticLayer:
+    """
+    Pre-composited surface of everything on a screen that does not change between frames.
+
+    Images are accumulated with premultiplied alpha, so drawing the layer gives the same
+    result as blitting each image onto the screen one by one. The layer is cropped to the
+    area actually covered once it is finished.
+    """
+
+    def __init__(self, size: Tuple[int, int]):
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.offset: Tuple[int, int] = (0, 0)
+        self._bounds: Optional[pygame.Rect] = None
+
+    def blit(self, image: pygame.Surface, pos: Tuple[float, float]) -> None:
+        # premul_alpha() crashes on zero-sized surfaces, e.g. an empty volume bar fill.
+        if not image.get_width() or not image.get_height():
+            return
+
+        rect = self.surface.blit(image.premul_alpha(), pos, special_flags=pygame.BLEND_PREMULTIPLIED)
+        self._bounds = rect if self._bounds is None else self._bounds.union(rect)
+
+    def finish(self) -> None:
+        if self._bounds is None or self._bounds.width == 0 or self._bounds.height == 0:
+            self.surface = None
+            return
+
+        self.surface = self.surface.subsurface(self._bounds).copy()
+        self.offset = self._bounds.topleft
+
+    def draw(self, screen: pygame.Surface) -> None:
+        if self.surface is not None:
+            screen.blit(self.surface, self.offset, special_flags=pygame.BLEND_PREMULTIPLIED)
+
+
+class LayerCache:
+    """
+    Keeps one StaticLayer per key (e.g. per menu state) until it is invalidated.
+    """
+
+    def __init__(self):
+        self._layers: Dict[Any, StaticLayer] = {}
+        self.builds = 0
+
+    def get(self, key: Any, size: Tuple[int, int], build: Callable[[StaticLayer], None]) -> StaticLayer:
+        """
+        Returns the cached layer for key, building it with build() if it is missing.
+        """
+        layer = self._layers.get(key)
+        if layer is None:
+            layer = StaticLayer(size)
+            build(layer)
+            layer.finish()
+            self._layers[key] = layer
+            self.builds += 1
+        return layer
+
+    def invalidate(self, key: Any = None) -> None:
+        """
+        Drops the layer of key, or every layer if no key is given.
+        """
+        if key is None:
+            self._layers.clear()
+        else:
+            self._layers.pop(key, None)
@@ -0,0 +1,337 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pygame
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from canvas import VirtualCanvas
+from config import Config
+from menu import Menu
+from profiler import percentile
+from utils import eFileType, eMenuState, file_name_map
+
+Frame = Callable[[Menu], List[pygame.event.Event]]
+"""Produces the input events of one frame from the current menu layout."""
+
+Scenario = Tuple[str, List[Frame]]
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "render_baseline.json")
+REGRESSION_TOLERANCE = 0.25
+REPEAT = 5
+
+
+def idle(frames: int) -> List[Frame]:
+    return [lambda menu: []] * frames
+
+
+def move(target: Callable[[Menu], Tuple[int, int]], buttons: Tuple[int, int, int] = (0, 0, 0)) -> Frame:
+    return lambda menu: [pygame.event.Event(pygame.MOUSEMOTION, pos=target(menu), rel=(0, 0), buttons=buttons)]
+
+
+def click(target: Callable[[Menu], Tuple[int, int]], settle: int = 2) -> List[Frame]:
+    """
+    Moves the mouse onto a target, presses and releases it on consecutive frames.
+    """
+    return [
+        move(target),
+        lambda menu: [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=target(menu), button=1)],
+        lambda menu: [pygame.event.Event(pygame.MOUSEBUTTONUP, pos=target(menu), button=1)],
+    ] + idle(settle)
+
+
+def drag(rect: Callable[[Menu], pygame.Rect], steps: int) -> List[Frame]:
+    """
+    Presses at the left edge of a rect and drags across it, one motion event per frame.
+    """
+    def point(i: int) -> Callable[[Menu], Tuple[int, int]]:
+        return lambda menu: (rect(menu).left + rect(menu).width * i // steps, rect(menu).centery)
+
+    return (
+        [lambda menu: [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=point(0)(menu), button=1)]]
+        + [move(point(i), (1, 0, 0)) for i in range(1, steps + 1)]
+        + [lambda menu: [pygame.event.Event(pygame.MOUSEBUTTONUP, pos=point(steps)(menu), button=1)]]
+    )
+
+
+def type_text(text: str) -> List[Frame]:
+    return [
+        lambda menu, ch=ch: [pygame.event.Event(pygame.KEYDOWN, key=ord(ch), unicode=ch, mod=0, scancode=0)]
+        for ch in text
+    ]
+
+
+def center_of(state: eMenuState, label: str) -> Callable[[Menu], Tuple[int, int]]:
+    return lambda menu: menu.buttons[state][label].center
+
+
+def scripted_scenarios() -> List[Scenario]:
+    """
+    Returns the default input script, split into scenarios that each start and end on the main menu.
+    """
+    main, options = eMenuState.MENU_STATE_MAIN, eMenuState.MENU_STATE_OPTIONS
+
+    hover_main = [move(center_of(main, label)) for label in ("play", "options", "exit")] * 10
+
+    options_script = (
+        click(center_of(main, "options"))
+        + drag(lambda menu: menu.volume_bar_rect, 30)
+        + click(center_of(options, "resolution"))
+        + [move(lambda menu, i=i: menu.resolution_options_rects[i % len(menu.resolution_options_rects)][1].center) for i in range(30)]
+        + click(center_of(options, "resolution"))
+        + click(center_of(options, "back"))
+    )
+
+    play_script = (
+        click(center_of(main, "play"))
+        + click(lambda menu: menu.progress_board.progress_slots[0]["play"].center)
+        + type_text("PLAYER ONE")
+        + [lambda menu: [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_BACKSPACE, unicode="\b", mod=0, scancode=0)]] * 4
+        + click(lambda menu: menu.progress_board.input_board.buttons["accept"].center)
+        + click(lambda menu: menu.progress_board.buttons["back"].center)
+    )
+
+    return [
+        ("main_menu", idle(60) + hover_main),
+        ("options", options_script),
+        ("play", play_script),
+    ]
+
+
+def encode_event(event: pygame.event.Event) -> Dict[str, Any]:
+    data = {key: list(value) if isinstance(value, tuple) else value for key, value in event.dict.items()}
+    return {"type": event.type, "dict": data}
+
+
+def decode_event(data: Dict[str, Any]) -> pygame.event.Event:
+    attrs = {key: tuple(value) if isinstance(value, list) else value for key, value in data["dict"].items()}
+    return pygame.event.Event(data["type"], **attrs)
+
+
+def load_recording(path: str) -> List[Scenario]:
+    """
+    Loads scenarios recorded with --record; every frame replays the exact events it saw.
+
+    Args:
+        path (str): Path of the recording.
+
+    Returns:
+        List[Scenario]: Recorded scenarios.
+    """
+    with open(path, "r", encoding="utf-8") as fp:
+        recording = json.load(fp)
+
+    return [
+        (name, [lambda menu, events=events: [decode_event(event) for event in events] for events in frames])
+        for name, frames in recording.items()
+    ]
+
+
+def peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def summarize(frame_times: List[float]) -> Dict[str, float]:
+    """
+    Returns the percentiles, max and mean in milliseconds of frame times given in seconds.
+    """
+    values = sorted(seconds * 1000.0 for seconds in frame_times)
+    return {
+        "p50": round(percentile(values, 0.50), 3),
+        "p95": round(percentile(values, 0.95), 3),
+        "p99": round(percentile(values, 0.99), 3),
+        "max": round(values[-1], 3) if values else 0.0,
+        "mean": round(sum(values) / len(values), 3) if values else 0.0,
+    }
+
+
+def measure(menu: Menu, scenarios: List[Scenario], repeat: int) -> Tuple[Dict[str, Any], Dict[str, List[List[Dict[str, Any]]]]]:
+    """
+    Plays the scenarios on an opened menu and times every frame.
+
+    Returns:
+        Tuple[Dict[str, Any], Dict[str, List[List[Dict[str, Any]]]]]: The scenario reports and
+            the replayed events per scenario.
+    """
+    recording: Dict[str, List[List[Dict[str, Any]]]] = {}
+    frame_times: Dict[str, List[float]] = {name: [] for name, _ in scenarios}
+    phases: Dict[str, Dict[str, Tuple[float, ...]]] = {}
+
+    for iteration in range(repeat + 1):
+        for name, frames in scenarios:
+            menu.profiler.samples.clear()
+            recorded = []
+
+            for frame in frames:
+                events = frame(menu)
+                recorded.append([encode_event(event) for event in events])
+
+                frame_start = time.perf_counter()
+                for event in events:
+                    menu.handle_event(event)
+                menu.update(1.0 / 60)
+                menu.render()
+                elapsed = time.perf_counter() - frame_start
+
+                if iteration:
+                    frame_times[name].append(elapsed)
+
+            recording[name] = recorded
+            phases[name] = menu.profiler.stats()
+
+    results = {
+        name: {
+            "frames": len(times),
+            "frame_ms": summarize(times),
+            "phases_ms": {phase: [round(value, 3) for value in values] for phase, values in phases[name].items()},
+        }
+        for name, times in frame_times.items()
+    }
+    return results, recording
+
+
+def run(scenarios: List[Scenario], resolution: Optional[Tuple[int, int]] = None, record: Optional[str] = None, repeat: int = REPEAT) -> Dict[str, Any]:
+    """
+    Drives a Menu frame by frame through the scenarios and measures it.
+
+    Frames run back to back without the frame-rate cap, so the frame times are the cost of
+    event handling, update and render alone. The scenarios are played once as a warm-up,
+    which fills the caches, and then repeat times for the measurement.
+
+    The menu runs on a default config in a temporary directory, so the settings the scripted
+    clicks toggle never reach the player's config, even if the run is interrupted.
+
+    Args:
+        scenarios (List[Scenario]): Input per frame, grouped into named scenarios.
+        resolution (Optional[Tuple[int, int]]): Window size to benchmark at; defaults to the default config resolution.
+        record (Optional[str]): Path to write the replayed events to, for later use with load_recording().
+        repeat (int): Number of measured passes.
+
+    Returns:
+        Dict[str, Any]: The report.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_name = file_name_map[eFileType.FILE_CONFIG]
+        open(os.path.join(tmp_dir, config_name), "w", encoding="utf-8").close()
+        config = Config(config_name, config_path=tmp_dir)
+
+        try:
+            start = time.perf_counter()
+
+            menu = Menu(config)
+            # The phase breakdown comes from the profiler, which is off by default.
+            menu.profiler.enabled = True
+            if resolution:
+                menu.config.resolution = resolution
+
+            menu.open()
+            menu.update(0.0)
+            menu.render()
+            startup = time.perf_counter() - start
+
+            report: Dict[str, Any] = {
+                "resolution": list(menu.display.get_size()),
+                "virtual_canvas": list(menu.canvas.size) if menu.canvas.enabled else None,
+                "startup_ms": round(startup * 1000.0, 3),
+            }
+            report["scenarios"], recording = measure(menu, scenarios, repeat)
+            report["peak_rss_mb"] = peak_rss_mb()
+        finally:
+            # Nothing may be written once the directory is gone, including the flush at exit.
+            config.unwatch()
+            config._dirty = False
+            pygame.quit()
+
+    if record:
+        with open(record, "w", encoding="utf-8") as fp:
+            json.dump(recording, fp)
+
+    return report
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = REGRESSION_TOLERANCE) -> List[str]:
+    """
+    Lists every metric that got worse than the baseline by more than the tolerance.
+
+    Args:
+        report (Dict[str, Any]): Current report.
+        baseline (Dict[str, Any]): Report to compare against.
+        tolerance (float): Allowed relative slowdown, e.g. 0.25 for 25 %.
+
+    Returns:
+        List[str]: One line per regression; empty if there are none.
+    """
+    checks = [("startup_ms", report.get("startup_ms"), baseline.get("startup_ms"))]
+    checks.append(("peak_rss_mb", report.get("peak_rss_mb"), baseline.get("peak_rss_mb")))
+
+    for name, scenario in report["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base:
+            continue
+        for metric in ("p50", "p95"):
+            checks.append((f"{name}.frame_ms.{metric}", scenario["frame_ms"][metric], base["frame_ms"][metric]))
+
+    return [
+        f"{metric}: {current} vs baseline {previous} (+{(current / previous - 1) * 100:.0f}%)"
+        for metric, current, previous in checks
+        if current is not None and previous and current > previous * (1 + tolerance)
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless UI rendering benchmark.")
+    parser.add_argument("--resolution", help="window size as WIDTHxHEIGHT")
+    parser.add_argument("--replay", help="replay a recording instead of the built-in script")
+    parser.add_argument("--record", help="write the replayed events to this file")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline report to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=REGRESSION_TOLERANCE, help="allowed relative slowdown")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="measured passes after the warm-up pass")
+    parser.add_argument("--canvas", action="store_true", help="draw on the virtual canvas regardless of VIRTUAL_CANVAS_MODE")
+    args = parser.parse_args()
+
+    if args.canvas:
+        VirtualCanvas(enabled=True)
+
+    size = tuple(int(value) for value in args.resolution.split("x")) if args.resolution else None
+    scenarios = load_recording(args.replay) if args.replay else scripted_scenarios()
+
+    result = run(scenarios, size, args.record, args.repeat)
+    text = json.dumps(result, indent=2)
+    print(text)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            fp.write(text)
+
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as fp:
+            fp.write(text)
+        print(f"Baseline written to {args.baseline}")
+
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as fp:
+            regressions = compare(result, json.load(fp), args.tolerance)
+
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        sys.exit(1 if regressions else 0)
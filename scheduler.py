@@ -0,0 +1,95 @@
+import time
+from typing import Callable, List, Optional
+
+from log import TRACE_LOG
+from utils import eLogLevel, SCHEDULER_MAX_DELAY, SCHEDULER_OVERDUE_SLICE
+
+FrameTask = Callable[[float], Optional[bool]]
+
+
+class ScheduledTask:
+    def __init__(self, name: str, func: FrameTask, priority: int, interval: float, max_delay: float):
+        self.name = name
+        self.func = func
+        self.priority = priority
+        self.interval = interval
+        self.max_delay = max_delay
+        self.next_run = time.perf_counter()
+
+
+class FrameScheduler:
+    """
+    Runs low-priority work in the time left over at the end of each frame.
+
+    Tasks are called with the deadline of the current frame in time.perf_counter() seconds
+    and should do only as much work as fits before it. Once the deadline has passed, the
+    remaining tasks wait for the next frame, so a slow task can never delay input or drawing
+    by more than its own run.
+
+    A task that has been due for longer than its max_delay runs even after the deadline,
+    so work like autosaving still happens while every frame is over budget. It is given a
+    deadline of SCHEDULER_OVERDUE_SLICE seconds from its start, so that budgeted work
+    still makes progress.
+    """
+
+    def __init__(self):
+        self._tasks: List[ScheduledTask] = []
+        self.overruns = 0
+
+    def add(self, name: str, func: FrameTask, priority: int = 0, interval: float = 0.0, max_delay: float = SCHEDULER_MAX_DELAY) -> None:
+        """
+        Registers a recurring task, replacing a task with the same name.
+
+        Args:
+            name (str): Unique task name.
+            func (FrameTask): Called with the frame deadline; returning True removes the task.
+            priority (int): Tasks with a higher priority run first.
+            interval (float): Minimum seconds between two runs.
+            max_delay (float): Seconds the task may be overdue before it runs regardless of the deadline.
+        """
+        self.remove(name)
+        self._tasks.append(ScheduledTask(name, func, priority, interval, max_delay))
+        self._tasks.sort(key=lambda task: -task.priority)
+
+    def remove(self, name: str) -> None:
+        self._tasks = [task for task in self._tasks if task.name != name]
+
+    def __contains__(self, name: str) -> bool:
+        return any(task.name == name for task in self._tasks)
+
+    def run(self, deadline: float) -> int:
+        """
+        Runs due tasks by priority until the deadline, and overdue tasks even after it.
+
+        Args:
+            deadline (float): End of the frame budget in time.perf_counter() seconds.
+
+        Returns:
+            int: Number of tasks that ran.
+        """
+        ran = 0
+        finished = []
+
+        for task in self._tasks:
+            now = time.perf_counter()
+            if now < task.next_run:
+                continue
+            if now >= deadline and now - task.next_run < task.max_delay:
+                continue
+
+            try:
+                if task.func(max(deadline, now + SCHEDULER_OVERDUE_SLICE)):
+                    finished.append(task.name)
+            except Exception as err:
+                TRACE_LOG(eLogLevel.LOG_LEVEL_ERROR, f"[FrameScheduler] Task {task.name} failed: {err}")
+                finished.append(task.name)
+
+            task.next_run = now + task.interval
+            ran += 1
+
+        if time.perf_counter() > deadline:
+            self.overruns += 1
+
+        for name in finished:
+            self.remove(name)
+        return ran
@@ -0,0 +1,120 @@
+import time
+from typing import List, Optional, Tuple
+
+from utils import singleton, STARTUP_TRACE
+
+StartupPhase = Tuple[str, float, float]
+"""(phase, start, duration) with times in time.perf_counter() seconds."""
+
+
+class _NullPhase:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+
+class _StartupPhase:
+    __slots__ = ("tracer", "name", "start")
+
+    def __init__(self, tracer: "StartupTracer", name: str):
+        self.tracer = tracer
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.tracer.phases.append((self.name, self.start, time.perf_counter() - self.start))
+
+
+_null_phase = _NullPhase()
+
+
+@singleton
+class StartupTracer:
+    """
+    Records how long each step between launching the game and its first frame takes.
+
+    The origin is the moment the tracer is first created, which main.py does before
+    importing anything else. Phases are timed with `with StartupTracer().phase("name"):`
+    blocks; finish() logs them once the first frame is on screen and hands them to the
+    Profiler, so they also show up in exported traces.
+
+    The module only depends on utils, so creating the tracer does not load pygame or
+    anything else it is meant to measure.
+    """
+
+    def __init__(self, enabled: bool = bool(STARTUP_TRACE)):
+        self.enabled = enabled
+        self.origin = time.perf_counter()
+        self.phases: List[StartupPhase] = []
+        self.finished_at: Optional[float] = None
+
+    def phase(self, name: str):
+        """
+        Returns a context manager timing the enclosed block as a startup phase.
+
+        Phases started after finish() are not recorded, so code that also runs later
+        (e.g. reopening the menu) can stay wrapped.
+        """
+        if not self.enabled or self.finished_at is not None:
+            return _null_phase
+        return _StartupPhase(self, name)
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Seconds from the origin to finish(), or to now if startup has not finished.
+        """
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return end - self.origin
+
+    def report(self) -> List[str]:
+        """
+        Returns one line per phase with its offset from the origin and its duration.
+        """
+        lines = [
+            f"{name:<12} +{(start - self.origin) * 1000.0:8.1f} ms {duration * 1000.0:8.1f} ms"
+            for name, start, duration in sorted(self.phases, key=lambda phase: phase[1])
+        ]
+        lines.append(f"{'total':<12} {'':>12} {self.elapsed * 1000.0:8.1f} ms")
+        return lines
+
+    def finish(self) -> None:
+        """
+        Ends the trace once the first frame is drawn. Only the first call has an effect.
+        """
+        if not self.enabled or self.finished_at is not None:
+            return
+        self.finished_at = time.perf_counter()
+
+        from log import TRACE_LOG
+        from profiler import Profiler
+        from utils import eLogLevel
+
+        for line in self.report():
+            TRACE_LOG(eLogLevel.LOG_LEVEL_LOG, f"[Startup] {line}")
+
+        profiler = Profiler()
+        if profiler.enabled:
+            profiler.samples.extend(("startup." + name, start, duration) for name, start, duration in self.phases)
+
+
+if __name__ == "__main__":
+    """
+    Debugging and manual testing block.
+    """
+    tracer = StartupTracer()
+
+    with tracer.phase("import"):
+        import pygame
+
+    with tracer.phase("display"):
+        pygame.init()
+
+    tracer.finish()
+    print("\n".join(tracer.report()))
@@ -0,0 +1,195 @@
+import pygame
+from typing import Dict, Tuple, Optional, List, NamedTuple, Iterable
+
+from utils import eFontType, get_font, GLYPH_ATLAS_SIZE
+
+Color = Tuple[int, ...]
+
+
+class Glyph(NamedTuple):
+    area: pygame.Rect
+    advance: int
+
+
+class GlyphAtlas:
+    """
+    Bitmap font built from a pygame font, for text that changes often.
+
+    Every glyph is rasterized once into a shared sheet together with its advance, and
+    kerning is measured per character pair on first use. Strings are then composed with a
+    single batched blits() call instead of a FreeType render and a new Surface per change.
+    """
+
+    def __init__(self, font_type: eFontType, font_size: int, color: Color, antialias: bool = True, sheet_size: int = GLYPH_ATLAS_SIZE):
+        """
+        Args:
+            font_type (eFontType): Font to rasterize.
+            font_size (int): Font size.
+            color (Color): Text color baked into the glyphs.
+            antialias (bool): Whether to antialias the glyphs.
+            sheet_size (int): Initial width and height of the glyph sheet.
+        """
+        self.font = get_font(font_type, font_size)
+        self.color = tuple(color)
+        self.antialias = antialias
+
+        self.height = self.font.get_height() if self.font else 0
+        self.sheet = pygame.Surface((sheet_size, sheet_size), pygame.SRCALPHA)
+
+        self._glyphs: Dict[str, Glyph] = {}
+        self._kerning: Dict[Tuple[str, str], int] = {}
+        self._pen = (0, 0)
+        self._shelf_height = 0
+
+    def preload(self, chars: Iterable[str]) -> None:
+        """
+        Rasterizes the given characters ahead of time, e.g. string.printable.
+        """
+        for char in chars:
+            self.glyph(char)
+
+    def glyph(self, char: str) -> Optional[Glyph]:
+        glyph = self._glyphs.get(char)
+        if glyph is None and self.font:
+            glyph = self._rasterize(char)
+        return glyph
+
+    def kerning(self, left: str, right: str) -> int:
+        """
+        Returns the horizontal correction between two neighbouring characters.
+        """
+        pair = (left, right)
+        kern = self._kerning.get(pair)
+        if kern is None:
+            kern = self.font.size(left + right)[0] - self.font.size(left)[0] - self.font.size(right)[0]
+            self._kerning[pair] = kern
+        return kern
+
+    def layout(self, text: str) -> Tuple[List[Tuple[pygame.Rect, Tuple[int, int]]], int]:
+        """
+        Places the glyphs of a string.
+
+        Args:
+            text (str): Text to lay out.
+
+        Returns:
+            Tuple[List[Tuple[pygame.Rect, Tuple[int, int]]], int]: (sheet area, offset) per glyph and the total width.
+        """
+        placed = []
+        pen = 0
+        previous = None
+
+        for char in text:
+            glyph = self.glyph(char)
+            if glyph is None:
+                continue
+
+            if previous is not None:
+                pen += self.kerning(previous, char)
+
+            placed.append((glyph.area, (pen, 0)))
+            pen += glyph.advance
+            previous = char
+
+        return placed, pen
+
+    def size(self, text: str) -> Tuple[int, int]:
+        return self.layout(text)[1], self.height
+
+    def draw(self, target: pygame.Surface, text: str, pos: Tuple[int, int]) -> pygame.Rect:
+        """
+        Draws text onto the target surface with one batched blit.
+
+        Args:
+            target (pygame.Surface): Surface to draw on.
+            text (str): Text to draw.
+            pos (Tuple[int, int]): Top-left corner of the text.
+
+        Returns:
+            pygame.Rect: Area covered by the text.
+        """
+        placed, width = self.layout(text)
+        x, y = pos
+
+        target.blits([(self.sheet, (x + dx, y + dy), area) for area, (dx, dy) in placed], doreturn=False)
+        return pygame.Rect(x, y, width, self.height)
+
+    def draw_centered(self, target: pygame.Surface, text: str, center: Tuple[int, int]) -> pygame.Rect:
+        width, height = self.size(text)
+        return self.draw(target, text, (center[0] - width // 2, center[1] - height // 2))
+
+    def _rasterize(self, char: str) -> Glyph:
+        surface = self.font.render(char, self.antialias, self.color)
+        width, height = surface.get_size()
+
+        x, y = self._pen
+        if x + width > self.sheet.get_width():
+            x, y = 0, y + self._shelf_height + 1
+            self._shelf_height = 0
+
+        while y + height > self.sheet.get_height() or width > self.sheet.get_width():
+            self._grow()
+
+        self.sheet.blit(surface, (x, y))
+        self._pen = (x + width + 1, y)
+        self._shelf_height = max(self._shelf_height, height)
+        self.height = max(self.height, height)
+
+        glyph = Glyph(pygame.Rect(x, y, width, height), width)
+        self._glyphs[char] = glyph
+        return glyph
+
+    def _grow(self) -> None:
+        width, height = self.sheet.get_size()
+        sheet = pygame.Surface((max(width, height), height * 2), pygame.SRCALPHA)
+        sheet.blit(self.sheet, (0, 0))
+        self.sheet = sheet
+
+
+_atlases: Dict[Tuple[eFontType, int, Color, bool], GlyphAtlas] = {}
+
+
+def glyph_atlas(font_type: eFontType, font_size: int, color: Color, antialias: bool = True) -> GlyphAtlas:
+    """
+    Returns the shared glyph atlas for a font, size and color, creating it on first use.
+
+    Args:
+        font_type (eFontType): Font to rasterize.
+        font_size (int): Font size.
+        color (Color): Text color.
+        antialias (bool): Whether to antialias the glyphs.
+
+    Returns:
+        GlyphAtlas: The glyph atlas.
+    """
+    key = (font_type, font_size, tuple(color), antialias)
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = GlyphAtlas(font_type, font_size, color, antialias)
+        _atlases[key] = atlas
+    return atlas
+
+
+if __name__ == "__main__":
+    """
+    Debugging and manual testing block.
+    """
+    import string
+    import time
+
+    pygame.init()
+    screen = pygame.display.set_mode((640, 120))
+
+    atlas = glyph_atlas(eFontType.FONT_TYPE_UPHEAVAL, 44, (0, 0, 0))
+    atlas.preload(string.printable)
+
+    start = time.perf_counter()
+    for i in range(10000):
+        atlas.draw(screen, f"PLAYER {i}", (10, 10))
+    print(f"glyph atlas: {10000 / (time.perf_counter() - start):.0f} strings/s")
+
+    font = get_font(eFontType.FONT_TYPE_UPHEAVAL, 44)
+    start = time.perf_counter()
+    for i in range(10000):
+        screen.blit(font.render(f"PLAYER {i}", True, (0, 0, 0)), (10, 10))
+    print(f"font.render: {10000 / (time.perf_counter() - start):.0f} strings/s")
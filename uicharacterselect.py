@@ -1,6 +1,25 @@
 import pygame
 from typing import Union
-from utils import base_path, get_font, eFontType, MAX_LEVEL, MAX_NAME_LEN
+from utils import render_text, eFontType, MAX_LEVEL, MAX_NAME_LEN
+from assets_manager import AssetsManager, button_states
+from text import glyph_atlas
+from widgets import WidgetRegistry
+from canvas import VirtualCanvas
+
+progress_board_assets: list[str] = [
+    "ui/input_name_dialog_gray.png",
+    "ui/bar_gray.png",
+    "ui/loads/select_progress_board.png",
+    "ui/loads/progress_frame_empty.png",
+    "ui/loads/level_bar.png",
+    "ui/loads/avatar.png",
+] + [
+    f"{folder}/{name}_{suffix}.png"
+    for folder, names in (("buttons", ("accept", "cancel")), ("ui/loads", ("play", "delete", "back")))
+    for name in names
+    for suffix in button_states.values()
+]
+"""Images used by ProgressBoard and its InputBoard, for preloading."""
 
 class InputBoard:
     def __init__(self, width: int, height: int, text: str = "Choose Your Name"):
@@ -10,11 +29,12 @@ class InputBoard:
         self._name = ""
         self.active = False
 
-        self.font = get_font(eFontType.FONT_TYPE_UPHEAVAL, 44)
-        self.dialog = pygame.image.load(base_path() + "/assets/ui/input_name_dialog_gray.png").convert_alpha()
+        self.name_text = glyph_atlas(eFontType.FONT_TYPE_UPHEAVAL, 44, (0, 0, 0))
+        self.assets = AssetsManager().scope()
+        self.dialog = self.assets.image("ui/input_name_dialog_gray.png")
         self.dialog_rect = self.dialog.get_rect(center=(width // 2, height // 2))
 
-        self.input = pygame.image.load(base_path() + "/assets/ui/bar_gray.png").convert_alpha()
+        self.input = self.assets.image("ui/bar_gray.png")
 #        self.input_rect = pygame.Rect(self.dialog_rect.centerx - 100, self.dialog_rect.centery - 10, 200, 40)
 
 
@@ -22,22 +42,14 @@ class InputBoard:
 
         self.button_images = {}
         self.buttons = {}
-        self.clicked_button = None
-        self.hovered_button = None
+        self.widgets = WidgetRegistry()
 
         self.load_buttons()
 
     def load_buttons(self):
-        def load_states(name):
-            return {
-                "default": pygame.image.load(base_path() + f"/assets/buttons/{name}_default.png").convert_alpha(),
-                "hover": pygame.image.load(base_path() + f"/assets/buttons/{name}_over.png").convert_alpha(),
-                "click": pygame.image.load(base_path() + f"/assets/buttons/{name}_click.png").convert_alpha(),
-            }
-
         self.button_images = {
-            "accept": load_states("accept"),
-            "cancel": load_states("cancel"),
+            "accept": self.assets.button_states("buttons", "accept"),
+            "cancel": self.assets.button_states("buttons", "cancel"),
         }
 
         self.buttons = {
@@ -45,6 +57,13 @@ class InputBoard:
             "cancel": self.button_images["cancel"]["default"].get_rect(topleft=(self.input_rect.right - self.button_images["cancel"]["default"].get_width(), self.input_rect.bottom + 20)),
         }
 
+        self.widgets.clear()
+        for key, rect in self.buttons.items():
+            self.widgets.register(key, rect)
+
+    def unload(self):
+        self.assets.release()
+
     def handle_event(self, event):
         if not self.active:
             return None
@@ -60,19 +79,14 @@ class InputBoard:
                 else:
                     self._name += event.unicode
 
+        elif event.type == pygame.MOUSEMOTION:
+            self.widgets.hover(event.pos)
+
         elif event.type == pygame.MOUSEBUTTONDOWN:
-            for key, rect in self.buttons.items():
-                if rect.collidepoint(event.pos):
-                    self.clicked_button = key
+            self.widgets.press(event.pos)
 
         elif event.type == pygame.MOUSEBUTTONUP:
-            if self.clicked_button:
-                key = self.clicked_button
-                rect = self.buttons.get(key)
-                if rect and rect.collidepoint(pygame.mouse.get_pos()):
-                    self.clicked_button = None
-                    return key
-            self.clicked_button = None
+            return self.widgets.release(event.pos)
     
         return None
 
@@ -81,17 +95,10 @@ class InputBoard:
         screen.blit(self.input, self.input_rect.topleft)
 
         # Vstupní pole
-        txt_surface = self.font.render(self._name, True, (0, 0, 0))
-        screen.blit(txt_surface, (self.input_rect.x + 10, self.input_rect.y + 5))
+        self.name_text.draw(screen, self._name, (self.input_rect.x + 10, self.input_rect.y + 5))
 
-        mouse_pos = pygame.mouse.get_pos()
         for key, rect in self.buttons.items():
-            if rect.collidepoint(mouse_pos):
-                state = "click" if self.clicked_button == key else "hover"
-            else:
-                state = "default"
-
-            screen.blit(self.button_images[key][state], rect.topleft)
+            screen.blit(self.button_images[key][self.widgets.state(key)], rect.topleft)
 
 class ProgressBoard:
     def __init__(self, width: int, height: int, character_name: str = "NONAME", character_level: int = MAX_LEVEL):
@@ -101,24 +108,21 @@ class ProgressBoard:
         self.__character_name = character_name
         self.__character_level = character_level
 
-        self.font = get_font(eFontType.FONT_TYPE_UPHEAVAL, 60)
-        self.small_font = get_font(eFontType.FONT_TYPE_UPHEAVAL, 24)
+        self.font_size = 60
+        self.level_text = glyph_atlas(eFontType.FONT_TYPE_UPHEAVAL, 24, (232, 232, 232))
 
         self.input_board = InputBoard(self.width, self.height, "Choose your name")
+        self.assets = AssetsManager().scope()
 
         self.board_images = {
-            "progress_board": pygame.image.load(base_path() + "/assets/ui/loads/select_progress_board.png").convert_alpha(),
-            "progress_frame": pygame.image.load(base_path() + "/assets/ui/loads/progress_frame_empty.png").convert_alpha(),
-            "level_bar": pygame.image.load(base_path() + "/assets/ui/loads/level_bar.png").convert_alpha(),
-            "avatar": pygame.image.load(base_path() + "/assets/ui/loads/avatar.png").convert_alpha(),
+            "progress_board": self.assets.image("ui/loads/select_progress_board.png"),
+            "progress_frame": self.assets.image("ui/loads/progress_frame_empty.png"),
+            "level_bar": self.assets.image("ui/loads/level_bar.png"),
+            "avatar": self.assets.image("ui/loads/avatar.png"),
         }
 
         def load_states(name):
-            return {
-                "default": pygame.image.load(base_path() + f"/assets/ui/loads/{name}_default.png").convert_alpha(),
-                "hover": pygame.image.load(base_path() + f"/assets/ui/loads/{name}_over.png").convert_alpha(),
-                "click": pygame.image.load(base_path() + f"/assets/ui/loads/{name}_click.png").convert_alpha(),
-            }
+            return self.assets.button_states("ui/loads", name)
 
         self.button_images = {
             "play": load_states("play"),
@@ -129,14 +133,14 @@ class ProgressBoard:
         self.is_empty_slot = True
 
         self.buttons = {}
-        self.clicked_button = None
-        self.hovered_button = None
+        self.widgets = WidgetRegistry()
 
         self.progress_slots = []
         self.progress_board_rect = None
 
         self.generate_progress_rects()
         self._init_back_button()
+        self.widgets.hover(VirtualCanvas().mouse_pos())
 
     def generate_progress_rects(self):
         board_rect = self.board_images["progress_board"].get_rect(center=(self.width // 2, self.height // 2))
@@ -146,6 +150,7 @@ class ProgressBoard:
         btn_size = self.button_images["play"]["default"].get_size()
 
         self.progress_slots.clear()
+        self.widgets.clear()
         spacing = 30
         start_y = board_rect.top + 40
         slot_height = frame_size[1]
@@ -181,16 +186,22 @@ class ProgressBoard:
                 "play": play_rect,
                 "delete": delete_rect
             })
+            self.widgets.register(("play", i), play_rect)
+            self.widgets.register(("delete", i), delete_rect)
 
         self.progress_board_rect = board_rect
 
+    def unload(self):
+        self.input_board.unload()
+        self.assets.release()
+
     def _init_back_button(self):
         back_img = self.button_images["back"]["default"]
         self.buttons["back"] = back_img.get_rect(midbottom=(self.width // 2, self.progress_board_rect.bottom - 40))
+        self.widgets.register("back", self.buttons["back"])
 
     def draw(self, screen):
         screen.blit(self.board_images["progress_board"], self.progress_board_rect.topleft)
-        mouse_pos = pygame.mouse.get_pos()
 
 
         for i, slot in enumerate(self.progress_slots):
@@ -198,29 +209,21 @@ class ProgressBoard:
             screen.blit(self.board_images["avatar"], slot["avatar"])
             screen.blit(self.board_images["level_bar"], slot["level_bar"])
 
-            name_surface = self.font.render(self.__character_name, True, (232, 232, 232))
+            name_surface = render_text(eFontType.FONT_TYPE_UPHEAVAL, self.font_size, self.__character_name, (232, 232, 232))
             name_rect = name_surface.get_rect(center=slot["name_center"])
             screen.blit(name_surface, name_rect)
 
-            level_text = self.small_font.render(f"LEVEL {self.__character_level}", True, (232, 232, 232))
-            level_text_rect = level_text.get_rect(center=slot["level_bar"].center)
-            screen.blit(level_text, level_text_rect)
+            self.level_text.draw_centered(screen, f"LEVEL {self.__character_level}", slot["level_bar"].center)
 
             for key in ("play", "delete"):
-                rect = slot[key]
-                if self.clicked_button == f"{key}_{i}" and rect.collidepoint(mouse_pos):
-                    state = "click"
-                elif rect.collidepoint(mouse_pos):
-                    state = "hover"
-                else:
-                    state = "default"
-                screen.blit(self.button_images[key][state], rect.topleft)
+                state = self.widgets.state((key, i))
+                screen.blit(self.button_images[key][state], slot[key].topleft)
 
         if self.input_board.active:
             self.input_board.draw(screen)
 
         back_rect = self.buttons["back"]
-        back_state = "hover" if back_rect.collidepoint(mouse_pos) else "default"
+        back_state = "hover" if self.widgets.hovered == "back" else "default"
         screen.blit(self.button_images["back"][back_state], back_rect.topleft)
 
     def handle_event(self, event):
@@ -234,36 +237,30 @@ class ProgressBoard:
                 self.input_board.active = False
             return None
 
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.buttons["back"].collidepoint(event.pos):
-                self.clicked_button = "back"
+        if event.type == pygame.MOUSEMOTION:
+            self.widgets.hover(event.pos)
 
-            for i, slot in enumerate(self.progress_slots):
-                for action in ("play", "delete"):
-                    if slot[action].collidepoint(event.pos):
-                        self.clicked_button = f"{action}_{i}"
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            self.widgets.press(event.pos)
 
         elif event.type == pygame.MOUSEBUTTONUP:
-            if self.clicked_button:
-                if self.clicked_button == "back" and self.buttons["back"].collidepoint(pygame.mouse.get_pos()):
-                    self.clicked_button = None
-                    return "back"
-
-                for i, slot in enumerate(self.progress_slots):
-                    for action in ("play", "delete"):
-                        if self.clicked_button == f"{action}_{i}" and slot[action].collidepoint(pygame.mouse.get_pos()):
-                            if action == "play":
-                                self._click_play_button()
-                            # delete logic
-                            self.clicked_button = None
-                            return f"{action}_{i}"
-
-            self.clicked_button = None
+            key = self.widgets.release(event.pos)
+            if key == "back":
+                return "back"
+
+            if key is not None:
+                action, i = key
+                if action == "play":
+                    self._click_play_button()
+                # delete logic
+                return f"{action}_{i}"
 
         return None
 
     def _click_play_button(self):
         if self.is_empty_slot:
             self.input_board.active = True
+            self.input_board.widgets.reset()
+            self.input_board.widgets.hover(VirtualCanvas().mouse_pos())
         else:
             print("Start game!")
\ No newline at end of file
@@ -1,15 +1,51 @@
-from typing import TypeVar, Callable, Dict, Any, Optional
+from typing import TYPE_CHECKING, TypeVar, Callable, Dict, Any, Optional, Tuple
+from collections import OrderedDict
 from functools import wraps
 from enum import Enum
 
-import pygame
-
 import os
 
+if TYPE_CHECKING:
+    import pygame
+
 MAX_NAME_LEN = 12
 MAX_LEVEL = 19
 DEBUG_MODE = 1
 FONT_SIZE_BOUNDS = [8,72]
+LOG_ASYNC_MODE = 0
+LOG_FLUSH_INTERVAL = 0.25
+FILE_POOL_SIZE = 8
+CONFIG_SAVE_DELAY = 1.0
+CONFIG_HOT_RELOAD = 0
+CONFIG_WATCH_INTERVAL_MS = 500
+ASSET_CACHE_BUDGET = 128 * 1024 * 1024
+ASSET_PRELOAD_WORKERS = 4
+ATLAS_MAX_SIZE = 2048
+ATLAS_INDEX_FILE = "atlas/atlas.json"
+BUNDLE_DATA_FILE = "bundle/assets.bin"
+BUNDLE_MANIFEST_FILE = "bundle/manifest.json"
+BACKGROUND_BUFFER_FRAMES = 8
+BACKGROUND_FRAME_DELAY = 150
+BACKGROUND_DELTA_MODE = 0
+BACKGROUND_DELTA_BANDS = 8
+DIRTY_RECT_RENDERING = 0
+TEXT_CACHE_SIZE = 256
+GLYPH_ATLAS_SIZE = 512
+HIT_GRID_CELL_SIZE = 64
+FRAME_RATE = 60
+UPDATE_RATE = 60
+MAX_UPDATE_STEPS = 5
+SCHEDULER_MAX_DELAY = 0.25
+SCHEDULER_OVERDUE_SLICE = 0.002
+IDLE_LOOP_MODE = 0
+IDLE_WAIT_TIMEOUT = 1000
+PROFILER_ENABLED = 0
+PROFILER_CAPACITY = 4096
+PROFILER_OVERLAY_INTERVAL = 0.5
+STARTUP_TRACE = 1
+VIRTUAL_CANVAS_MODE = 0
+VIRTUAL_CANVAS_SIZE = (1280, 720)
+VIRTUAL_CANVAS_SMOOTH = 1
 
 class eMenuState(Enum):
     """
@@ -189,9 +225,9 @@ def base_path() -> str:
     cur_path: str = os.path.abspath(__file__)
     return os.path.dirname(os.path.dirname(cur_path))
 
-_font_cache: dict[tuple[eFontType, int], pygame.font.Font] = {}
+_font_cache: "dict[tuple[eFontType, int], pygame.font.Font]" = {}
 
-def get_font(font_type: eFontType, font_size: int) -> Optional[pygame.font.Font]:
+def get_font(font_type: eFontType, font_size: int) -> "Optional[pygame.font.Font]":
     key = (font_type, font_size)
     if key in _font_cache:
         return _font_cache[key]
@@ -202,7 +238,68 @@ def get_font(font_type: eFontType, font_size: int) -> Optional[pygame.font.Font]
     return font
 
 
-def load_font(font_type: eFontType, font_size: int) -> Optional[pygame.font.Font]:
+TextKey = Tuple[eFontType, int, str, Tuple[int, ...], bool]
+
+
+class TextRenderCache:
+    """
+    Bounded LRU cache of rendered text surfaces.
+
+    Keyed by (font type, size, text, color, antialias), so text that does not change
+    between frames is rasterized only once.
+    """
+
+    def __init__(self, max_size: int = TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self._surfaces: "OrderedDict[TextKey, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font_type: eFontType, font_size: int, text: str, color: Tuple[int, ...], antialias: bool = True) -> "Optional[pygame.Surface]":
+        key = (font_type, font_size, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        font = get_font(font_type, font_size)
+        if not font:
+            return None
+
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+
+
+text_cache = TextRenderCache()
+
+
+def render_text(font_type: eFontType, font_size: int, text: str, color: Tuple[int, ...], antialias: bool = True) -> "Optional[pygame.Surface]":
+    """
+    Renders text through the shared text cache.
+
+    Args:
+        font_type (eFontType): Font to render with.
+        font_size (int): Font size.
+        text (str): Text to render.
+        color (Tuple[int, ...]): Text color.
+        antialias (bool): Whether to antialias the text.
+
+    Returns:
+        Optional[pygame.Surface]: The rendered text, or None if the font could not be loaded.
+    """
+    return text_cache.render(font_type, font_size, text, color, antialias)
+
+
+def load_font(font_type: eFontType, font_size: int) -> "Optional[pygame.font.Font]":
 
     if font_size not in range(FONT_SIZE_BOUNDS[0], FONT_SIZE_BOUNDS[1]):
         return False
@@ -221,6 +318,10 @@ def load_font(font_type: eFontType, font_size: int) -> Optional[pygame.font.Font
         print(f"[Font] Font file not found: {font_path}")
         return None
 
+    # Imported on first use so that modules which only need the constants and helpers
+    # (log, config, file_manager) do not pay for loading pygame.
+    import pygame
+
     try:
         return pygame.font.Font(font_path, font_size)
     except Exception as e:
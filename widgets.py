@@ -0,0 +1,217 @@
+import pygame
+from typing import Dict, List, Tuple, Optional, Hashable, Set
+
+from utils import HIT_GRID_CELL_SIZE
+
+WidgetKey = Hashable
+Cell = Tuple[int, int]
+
+
+class SpatialIndex:
+    """
+    Uniform grid over widget rectangles.
+
+    Every rect is stored in each grid cell it overlaps, so a point query only tests the
+    few rects sharing its cell, however many widgets the screen holds. Rects inserted later
+    are considered on top of earlier ones.
+    """
+
+    def __init__(self, cell_size: int = HIT_GRID_CELL_SIZE):
+        """
+        Args:
+            cell_size (int): Width and height of a grid cell in pixels.
+        """
+        self.cell_size = cell_size
+        self._cells: Dict[Cell, List[WidgetKey]] = {}
+        self._rects: Dict[WidgetKey, pygame.Rect] = {}
+
+    def _cells_of(self, rect: pygame.Rect) -> List[Cell]:
+        size = self.cell_size
+        return [
+            (cx, cy)
+            for cx in range(rect.left // size, (rect.right - 1) // size + 1)
+            for cy in range(rect.top // size, (rect.bottom - 1) // size + 1)
+        ]
+
+    def insert(self, key: WidgetKey, rect: pygame.Rect) -> None:
+        if key in self._rects:
+            self.remove(key)
+
+        rect = pygame.Rect(rect)
+        self._rects[key] = rect
+        for cell in self._cells_of(rect):
+            self._cells.setdefault(cell, []).append(key)
+
+    def remove(self, key: WidgetKey) -> None:
+        rect = self._rects.pop(key, None)
+        if rect is None:
+            return
+
+        for cell in self._cells_of(rect):
+            keys = self._cells.get(cell)
+            if keys:
+                keys.remove(key)
+                if not keys:
+                    del self._cells[cell]
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._rects.clear()
+
+    def rect(self, key: WidgetKey) -> Optional[pygame.Rect]:
+        return self._rects.get(key)
+
+    def query(self, pos: Tuple[int, int]) -> Optional[WidgetKey]:
+        """
+        Returns the topmost widget containing the point.
+
+        Args:
+            pos (Tuple[int, int]): Point in screen coordinates.
+
+        Returns:
+            Optional[WidgetKey]: Key of the widget, or None if no widget contains the point.
+        """
+        keys = self._cells.get((pos[0] // self.cell_size, pos[1] // self.cell_size))
+        if not keys:
+            return None
+
+        for key in reversed(keys):
+            if self._rects[key].collidepoint(pos):
+                return key
+        return None
+
+    def __contains__(self, key: WidgetKey) -> bool:
+        return key in self._rects
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+
+class WidgetRegistry:
+    """
+    Widgets of one screen with their hover and press state.
+
+    Hover is recomputed only when the mouse moves and cached, so drawing just reads
+    state() instead of testing every widget against the mouse position each frame.
+    """
+
+    def __init__(self, cell_size: int = HIT_GRID_CELL_SIZE):
+        self.index = SpatialIndex(cell_size)
+        self._hoverable: Set[WidgetKey] = set()
+
+        self.hovered: Optional[WidgetKey] = None
+        self.pressed: Optional[WidgetKey] = None
+
+    def register(self, key: WidgetKey, rect: pygame.Rect, hoverable: bool = True) -> None:
+        """
+        Adds a widget on top of the already registered ones, or moves an existing one.
+
+        Args:
+            key (WidgetKey): Key returned by hit tests for this widget.
+            rect (pygame.Rect): Screen area of the widget.
+            hoverable (bool): Whether the widget has a hover state.
+        """
+        self.index.insert(key, rect)
+        if hoverable:
+            self._hoverable.add(key)
+        else:
+            self._hoverable.discard(key)
+
+    def unregister(self, key: WidgetKey) -> None:
+        self.index.remove(key)
+        self._hoverable.discard(key)
+
+        if self.hovered == key:
+            self.hovered = None
+        if self.pressed == key:
+            self.pressed = None
+
+    def clear(self) -> None:
+        self.index.clear()
+        self._hoverable.clear()
+        self.reset()
+
+    def reset(self) -> None:
+        self.hovered = None
+        self.pressed = None
+
+    def rect(self, key: WidgetKey) -> Optional[pygame.Rect]:
+        return self.index.rect(key)
+
+    def hit(self, pos: Tuple[int, int]) -> Optional[WidgetKey]:
+        return self.index.query(pos)
+
+    def hover(self, pos: Tuple[int, int]) -> List[pygame.Rect]:
+        """
+        Updates the hovered widget for a new mouse position.
+
+        Args:
+            pos (Tuple[int, int]): Mouse position.
+
+        Returns:
+            List[pygame.Rect]: Rects of the widgets whose hover state changed.
+        """
+        key = self.index.query(pos)
+        if key not in self._hoverable:
+            key = None
+
+        if key == self.hovered:
+            return []
+
+        changed = [self.rect(k) for k in (self.hovered, key) if k is not None]
+        self.hovered = key
+        return changed
+
+    def press(self, pos: Tuple[int, int]) -> Optional[WidgetKey]:
+        self.pressed = self.index.query(pos)
+        return self.pressed
+
+    def release(self, pos: Tuple[int, int]) -> Optional[WidgetKey]:
+        """
+        Ends a press.
+
+        Args:
+            pos (Tuple[int, int]): Mouse position on release.
+
+        Returns:
+            Optional[WidgetKey]: The pressed widget if the mouse was released over it, otherwise None.
+        """
+        pressed = self.pressed
+        self.pressed = None
+
+        if pressed is not None and self.index.query(pos) == pressed:
+            return pressed
+        return None
+
+    def state(self, key: WidgetKey) -> str:
+        """
+        Returns the button image state of a widget: "default", "hover" or "click".
+        """
+        if key != self.hovered:
+            return "default"
+        return "click" if key == self.pressed else "hover"
+
+
+if __name__ == "__main__":
+    """
+    Debugging and manual testing block.
+    """
+    import random
+    import time
+
+    registry = WidgetRegistry()
+    rects = [pygame.Rect(x * 40, y * 40, 36, 36) for x in range(40) for y in range(25)]
+    for i, rect in enumerate(rects):
+        registry.register(i, rect)
+
+    points = [(random.randrange(1600), random.randrange(1000)) for _ in range(10000)]
+
+    start = time.perf_counter()
+    for point in points:
+        registry.hit(point)
+    print(f"grid: {len(points) / (time.perf_counter() - start):.0f} queries/s over {len(rects)} widgets")
+
+    start = time.perf_counter()
+    for point in points:
+        next((i for i, rect in enumerate(rects) if rect.collidepoint(point)), None)
+    print(f"linear: {len(points) / (time.perf_counter() - start):.0f} queries/s over {len(rects)} widgets")